@@ -14,3 +14,16 @@ class MCPAtlassianNotFoundError(MCPAtlassianError):
     """Raised when a requested resource is not found (404)."""
 
     pass
+
+
+class MCPAtlassianBulkCreateError(MCPAtlassianError):
+    """Raised when a bulk create fails after the server may have created items.
+
+    Attributes:
+        created_ids: IDs the server reported as created, to reconcile against
+            before retrying
+    """
+
+    def __init__(self, message: str, created_ids: list[int] | None = None) -> None:
+        super().__init__(message)
+        self.created_ids = created_ids or []
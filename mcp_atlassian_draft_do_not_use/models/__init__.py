@@ -6,8 +6,10 @@ including conversion methods from API responses to structured models and
 simplified dictionaries for API responses.
 """
 
+from typing import TYPE_CHECKING, Any
+
 # Re-export models for easier imports
-from .base import ApiModel, TimestampMixin
+from .base import ApiModel, SimplifiedDictMixin, TimestampMixin
 
 # Confluence models (Import from the new structure)
 from .confluence import (
@@ -57,23 +59,46 @@ from .jira import (
     JiraWorklog,
 )
 
-# Zephyr models
-from .zephyr import (
-    TestStep,
-    TestStepRequest,
-    ZephyrTestCase,
-    ZephyrTestPlan,
-    ZephyrTestResult,
-    ZephyrTestRun,
-    ZephyrTestSteps,
+# Zephyr models are loaded lazily through __getattr__ below
+if TYPE_CHECKING:
+    from .zephyr import (
+        TestStep,
+        TestStepRequest,
+        ZephyrTestCase,
+        ZephyrTestPlan,
+        ZephyrTestResult,
+        ZephyrTestRun,
+        ZephyrTestSteps,
+    )
+
+_ZEPHYR_MODELS = frozenset(
+    {
+        "TestStep",
+        "TestStepRequest",
+        "ZephyrTestCase",
+        "ZephyrTestPlan",
+        "ZephyrTestResult",
+        "ZephyrTestRun",
+        "ZephyrTestSteps",
+    }
 )
 
+
+def __getattr__(name: str) -> Any:
+    if name in _ZEPHYR_MODELS:
+        from . import zephyr
+
+        return getattr(zephyr, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Additional models will be added as they are implemented
 
 __all__ = [
     # Base models
     "ApiModel",
     "TimestampMixin",
+    "SimplifiedDictMixin",
     # Constants
     "CONFLUENCE_DEFAULT_ID",
     "CONFLUENCE_DEFAULT_SPACE",
@@ -6,16 +6,25 @@ Jira and Confluence models to ensure consistent behavior and reduce
 code duplication.
 """
 
+from collections.abc import Callable
 from datetime import datetime
-from typing import Any, TypeVar
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, ClassVar, TypeVar
 
 from pydantic import BaseModel
 
+from ..utils.env import is_env_truthy
 from .constants import EMPTY_STRING
 
 # Type variable for the return type of from_api_response
 T = TypeVar("T", bound="ApiModel")
 
+# Run full Pydantic validation when building models from API responses.
+# Off by default: responses are trusted and already decoded, so models are
+# built with model_construct(). Set MCP_ATLASSIAN_VALIDATE=1 to re-enable.
+VALIDATE_API_MODELS = is_env_truthy("MCP_ATLASSIAN_VALIDATE")
+
 
 class ApiModel(BaseModel):
     """
@@ -43,6 +52,23 @@ class ApiModel(BaseModel):
         """
         raise NotImplementedError("Subclasses must implement from_api_response")
 
+    @classmethod
+    def from_api_values(cls: type[T], **values: Any) -> T:
+        """
+        Build a model instance from values already mapped from an API response.
+
+        Validation is skipped unless VALIDATE_API_MODELS is enabled.
+
+        Args:
+            **values: Field values keyed by field name
+
+        Returns:
+            An instance of the model
+        """
+        if VALIDATE_API_MODELS:
+            return cls(**values)
+        return cls.model_construct(**values)
+
     def to_simplified_dict(self) -> dict[str, Any]:
         """
         Convert the model to a simplified dictionary for API responses.
@@ -124,3 +150,64 @@ class TimestampMixin:
             return True
         except (ValueError, TypeError):
             return False
+
+
+@lru_cache(maxsize=None)
+def _fields_getter(names: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    """Return a callable fetching the named attributes as a tuple."""
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    if not names:
+        return lambda obj: ()
+    return attrgetter(*names)
+
+
+class SimplifiedDictMixin(TimestampMixin):
+    """
+    Mixin implementing to_simplified_dict from per-class field specs.
+
+    Keys are emitted in spec order: required fields, counts, derived
+    values, then the optional fields in _SIMPLIFIED_OPTIONAL order.
+    """
+
+    # Fields always emitted as-is
+    _SIMPLIFIED_REQUIRED: ClassVar[tuple[str, ...]] = ()
+    # (output key, list attribute) pairs emitted as the list length; an API
+    # null kept by from_api_values counts as an empty list
+    _SIMPLIFIED_COUNTS: ClassVar[tuple[tuple[str, str], ...]] = ()
+    # (output key, attribute) pairs always emitted, e.g. formatted timestamps
+    _SIMPLIFIED_DERIVED: ClassVar[tuple[tuple[str, str], ...]] = ()
+    # Fields emitted only when truthy, in output order
+    _SIMPLIFIED_OPTIONAL: ClassVar[tuple[str, ...]] = ()
+    # Optional fields emitted whenever they are not None (e.g. a zero count)
+    _SIMPLIFIED_NOT_NONE: ClassVar[tuple[str, ...]] = ()
+    # Optional fields emitted as formatted timestamps
+    _SIMPLIFIED_OPTIONAL_TIMESTAMPS: ClassVar[tuple[str, ...]] = ()
+
+    def to_simplified_dict(self) -> dict[str, Any]:
+        """
+        Convert the model to a simplified dictionary for API responses.
+
+        Returns:
+            A dictionary with the fields described by the class specs
+        """
+        cls = type(self)
+        result = dict(
+            zip(cls._SIMPLIFIED_REQUIRED, _fields_getter(cls._SIMPLIFIED_REQUIRED)(self))
+        )
+        for key, name in cls._SIMPLIFIED_COUNTS:
+            result[key] = len(getattr(self, name) or ())
+        for key, name in cls._SIMPLIFIED_DERIVED:
+            result[key] = getattr(self, name)
+        for name, value in zip(
+            cls._SIMPLIFIED_OPTIONAL, _fields_getter(cls._SIMPLIFIED_OPTIONAL)(self)
+        ):
+            if name in cls._SIMPLIFIED_NOT_NONE:
+                if value is not None:
+                    result[name] = value
+            elif value:
+                if name in cls._SIMPLIFIED_OPTIONAL_TIMESTAMPS:
+                    value = self.format_timestamp(value)
+                result[name] = value
+        return result
@@ -1,17 +1,69 @@
-"""Zephyr models package."""
+"""Zephyr models package.
+
+Models are imported from their submodules on first attribute access
+(PEP 562), so importing the package does not build every Zephyr model.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .common import ZephyrApiModel
+    from .requests import (
+        EnvironmentCreate,
+        TestCaseCreate,
+        TestCaseUpdate,
+        TestPlanCreate,
+        TestResultCreate,
+        TestRunCreate,
+    )
+    from .test_step import TestStep, TestStepRequest, ZephyrTestSteps
+    from .testcase import ZephyrTestCase
+    from .testplan import ZephyrTestPlan
+    from .testresult import ZephyrTestResult
+    from .testrun import ZephyrTestRun
+
+# Exported name -> submodule defining it
+_LAZY_MODELS = {
+    "TestStep": "test_step",
+    "TestStepRequest": "test_step",
+    "ZephyrTestSteps": "test_step",
+    "ZephyrTestCase": "testcase",
+    "ZephyrTestPlan": "testplan",
+    "ZephyrTestResult": "testresult",
+    "ZephyrTestRun": "testrun",
+    "ZephyrApiModel": "common",
+    "TestCaseCreate": "requests",
+    "TestCaseUpdate": "requests",
+    "TestPlanCreate": "requests",
+    "TestRunCreate": "requests",
+    "TestResultCreate": "requests",
+    "EnvironmentCreate": "requests",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_MODELS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
 
-from .test_step import TestStep, TestStepRequest, ZephyrTestSteps
-from .testcase import ZephyrTestCase
-from .testplan import ZephyrTestPlan
-from .testresult import ZephyrTestResult
-from .testrun import ZephyrTestRun
 
 __all__ = [
     "TestStep",
-    "TestStepRequest", 
+    "TestStepRequest",
     "ZephyrTestSteps",
     "ZephyrTestCase",
     "ZephyrTestPlan",
     "ZephyrTestResult",
     "ZephyrTestRun",
-] 
\ No newline at end of file
+    "ZephyrApiModel",
+    "TestCaseCreate",
+    "TestCaseUpdate",
+    "TestPlanCreate",
+    "TestRunCreate",
+    "TestResultCreate",
+    "EnvironmentCreate",
+]
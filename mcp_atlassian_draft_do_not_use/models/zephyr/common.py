@@ -0,0 +1,153 @@
+"""Common base for Zephyr entity models."""
+
+import logging
+from functools import cached_property, lru_cache
+from typing import Any, ClassVar, TypeVar
+
+from pydantic import ConfigDict, TypeAdapter, ValidationError
+from pydantic.alias_generators import to_camel
+
+from mcp_atlassian.models.base import ApiModel, SimplifiedDictMixin
+from mcp_atlassian.utils.serialization import dumps_bytes, loads
+
+logger = logging.getLogger(__name__)
+
+# Type variable for the return type of from_api_bytes
+Z = TypeVar("Z", bound="ZephyrApiModel")
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type["ZephyrApiModel"]) -> TypeAdapter:
+    """Return the shared list[model] TypeAdapter, built once per model class."""
+    return TypeAdapter(list[model])
+
+
+class ZephyrApiModel(SimplifiedDictMixin, ApiModel):
+    """Base model for Zephyr entities returned by the Zephyr Scale REST API.
+
+    Field names map to the API's camelCase keys through the alias generator,
+    which lets a raw response body be decoded straight into the model.
+    Subclasses define the created_on and last_modified_on timestamp fields.
+    """
+
+    # Validators and serializers are only built the first time a model is
+    # validated or dumped, keeping import cheap for unused models
+    model_config = ConfigDict(
+        frozen=True,
+        alias_generator=to_camel,
+        populate_by_name=True,
+        defer_build=True,
+    )
+
+    # (field name, API key) pairs read by from_api_response
+    _API_FIELDS: ClassVar[tuple[tuple[str, str], ...]] = ()
+
+    _SIMPLIFIED_DERIVED: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("created_on", "created_on_formatted"),
+        ("last_modified_on", "last_modified_on_formatted"),
+    )
+
+    @classmethod
+    def from_api_response(cls: type[Z], data: dict[str, Any], **kwargs: Any) -> Z:
+        """Create a model from a Zephyr API response using _API_FIELDS.
+
+        Args:
+            data: API response data
+            **kwargs: Additional context parameters
+
+        Returns:
+            Model instance
+        """
+        values = {name: data[key] for name, key in cls._API_FIELDS if key in data}
+        return cls.from_api_values(**values)
+
+    @cached_property
+    def created_on_formatted(self) -> str:
+        """Formatted creation timestamp, parsed once per instance."""
+        return self.format_timestamp(self.created_on)
+
+    @cached_property
+    def last_modified_on_formatted(self) -> str:
+        """Formatted last-modified timestamp, parsed once per instance."""
+        return self.format_timestamp(self.last_modified_on)
+
+    @classmethod
+    def from_api_bytes(cls: type[Z], data: bytes | str) -> Z:
+        """Create a model directly from a raw JSON response body.
+
+        The body is parsed and validated in a single pydantic-core pass,
+        without building an intermediate dict first. A body that fails
+        validation (e.g. a null list field) is decoded and handed to
+        from_api_response instead.
+
+        Args:
+            data: Raw JSON response body
+
+        Returns:
+            Model instance
+        """
+        try:
+            return cls.model_validate_json(data)
+        except ValidationError:
+            return cls.from_api_response(loads(data))
+
+    @classmethod
+    def from_list(cls: type[Z], data: list[dict[str, Any]]) -> list[Z]:
+        """Create models from a page of API response items in one pass.
+
+        The whole page is validated by a cached list TypeAdapter. If any item
+        fails validation, the page is parsed item by item instead and items
+        that cannot be parsed are skipped with a warning.
+
+        Args:
+            data: List of API response items
+
+        Returns:
+            List of model instances
+        """
+        try:
+            return _list_adapter(cls).validate_python(data)
+        except ValidationError:
+            pass
+
+        items = []
+        for item in data:
+            try:
+                items.append(cls.from_api_response(item))
+            except Exception as e:
+                logger.warning("Failed to parse %s data: %s", cls.__name__, e)
+        return items
+
+    @classmethod
+    def from_list_bytes(cls: type[Z], data: bytes) -> list[Z]:
+        """Create models from a raw JSON response body holding a page of items.
+
+        A bare JSON array is parsed and validated in one pydantic-core pass,
+        so no intermediate list of dicts is built. Bodies wrapped as
+        {"results": [...]}, and pages with items that fail validation, are
+        decoded first and handed to from_list.
+
+        Args:
+            data: Raw JSON response body
+
+        Returns:
+            List of model instances
+        """
+        if data.startswith(b"["):
+            try:
+                return _list_adapter(cls).validate_json(data)
+            except ValidationError:
+                pass
+
+        result = loads(data)
+        if isinstance(result, dict):
+            result = result.get("results", [])
+        return cls.from_list(result)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the simplified representation of the model to JSON.
+
+        Returns:
+            The output of to_simplified_dict encoded as UTF-8 JSON bytes
+        """
+        return dumps_bytes(self.to_simplified_dict())
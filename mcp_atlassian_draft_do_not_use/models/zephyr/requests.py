@@ -0,0 +1,120 @@
+"""Zephyr request payload models accepted by the Zephyr tools."""
+
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
+
+
+class ZephyrRequestModel(BaseModel):
+    """Base model for Zephyr create/update payloads.
+
+    Fields are exposed under the API's camelCase names. Keys not declared on
+    the model are kept and forwarded to the API unchanged.
+    """
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+        extra="allow",
+    )
+
+    def to_api_payload(self) -> dict[str, Any]:
+        """Convert to the JSON body expected by the Zephyr API.
+
+        Returns:
+            Dictionary keyed by camelCase API names with only the fields the
+            caller supplied; an explicit null is sent so it can clear a field
+        """
+        return self.model_dump(by_alias=True, exclude_unset=True)
+
+
+class TestCaseCreate(ZephyrRequestModel):
+    """Payload for creating a test case."""
+
+    name: str
+    project_key: str
+    status: str | None = None
+    priority: str | None = None
+    component: str | None = None
+    folder: str | None = None
+    owner: str | None = None
+    estimated_time: int | None = None
+    labels: list[str] | None = None
+    objective: str | None = None
+    precondition: str | None = None
+    custom_fields: dict[str, Any] | None = None
+    issue_links: list[str] | None = None
+    test_script: dict[str, Any] | None = None
+
+
+class TestCaseUpdate(ZephyrRequestModel):
+    """Payload for updating a test case; only the fields set are changed."""
+
+    name: str | None = None
+    status: str | None = None
+    priority: str | None = None
+    component: str | None = None
+    folder: str | None = None
+    owner: str | None = None
+    estimated_time: int | None = None
+    labels: list[str] | None = None
+    objective: str | None = None
+    precondition: str | None = None
+    custom_fields: dict[str, Any] | None = None
+    issue_links: list[str] | None = None
+    test_script: dict[str, Any] | None = None
+
+
+class TestPlanCreate(ZephyrRequestModel):
+    """Payload for creating a test plan."""
+
+    name: str
+    project_key: str
+    status: str | None = None
+    objective: str | None = None
+    folder: str | None = None
+    owner: str | None = None
+    labels: list[str] | None = None
+    custom_fields: dict[str, Any] | None = None
+    issue_links: list[str] | None = None
+
+
+class TestRunCreate(ZephyrRequestModel):
+    """Payload for creating a test run."""
+
+    name: str
+    project_key: str
+    status: str | None = None
+    folder: str | None = None
+    owner: str | None = None
+    planned_start_date: str | None = None
+    planned_end_date: str | None = None
+    test_plan_key: str | None = None
+    issue_key: str | None = None
+    version: str | None = None
+    iteration: str | None = None
+    environment: str | None = None
+    items: list[dict[str, Any]] | None = None
+    custom_fields: dict[str, Any] | None = None
+
+
+class TestResultCreate(ZephyrRequestModel):
+    """Payload for creating a test result."""
+
+    test_case_key: str
+    status: str | None = None
+    actual_start_date: str | None = None
+    actual_end_date: str | None = None
+    comment: str | None = None
+    executed_by: str | None = None
+    environment: str | None = None
+    custom_fields: dict[str, Any] | None = None
+
+
+class EnvironmentCreate(ZephyrRequestModel):
+    """Payload for creating an environment."""
+
+    name: str
+    project_key: str
+    description: str | None = None
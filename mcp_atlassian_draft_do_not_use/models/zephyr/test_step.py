@@ -1,12 +1,23 @@
 """Zephyr test step models."""
 
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any
 
+from pydantic import ConfigDict, TypeAdapter
+
 from mcp_atlassian.models.base import ApiModel
 
 
 class TestStep(ApiModel):
-    """Represents a test step in Zephyr."""
+    """Represents a test step in Zephyr.
+
+    data and result are never None, so the inherited to_simplified_dict
+    (model_dump(exclude_none=True), run by pydantic-core) only drops an
+    unset step_id.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     order_id: int
     step: str
@@ -25,35 +36,39 @@ class TestStep(ApiModel):
         Returns:
             TestStep instance
         """
-        return cls(
+        return cls.from_api_values(
             order_id=data.get("orderId", 0),
             step=data.get("step", ""),
-            data=data.get("data", ""),
-            result=data.get("result", ""),
+            data=data.get("data") or "",
+            result=data.get("result") or "",
             step_id=data.get("id"),
         )
 
-    def to_simplified_dict(self) -> dict[str, Any]:
-        """Convert to simplified dictionary for API responses.
-        
+    @staticmethod
+    def to_simplified_list(steps: Sequence["TestStep"]) -> list[dict[str, Any]]:
+        """Convert a list of steps to simplified dictionaries in one call.
+
+        Args:
+            steps: Test steps to convert
+
         Returns:
-            Dictionary with essential test step fields
+            List of simplified step dictionaries
         """
-        result = {
-            "order_id": self.order_id,
-            "step": self.step,
-            "data": self.data,
-            "result": self.result,
-        }
-        
-        if self.step_id is not None:
-            result["step_id"] = self.step_id
-            
-        return result
+        return _step_list_adapter().dump_python(list(steps), exclude_none=True)
+
+
+@lru_cache(maxsize=1)
+def _step_list_adapter() -> TypeAdapter[list[TestStep]]:
+    """Return the shared list[TestStep] adapter, built on first use."""
+    return TypeAdapter(list[TestStep])
 
 
 class TestStepRequest(ApiModel):
-    """Request model for creating test steps."""
+    """Request model for creating test steps.
+
+    to_simplified_dict is inherited from ApiModel: model_dump(exclude_none=True)
+    already yields step plus whichever of data and result are set.
+    """
 
     step: str
     data: str | None = None
@@ -70,28 +85,12 @@ class TestStepRequest(ApiModel):
         Returns:
             TestStepRequest instance
         """
-        return cls(
+        return cls.from_api_values(
             step=data.get("step", ""),
             data=data.get("data"),
             result=data.get("result"),
         )
 
-    def to_simplified_dict(self) -> dict[str, Any]:
-        """Convert to simplified dictionary for API requests.
-        
-        Returns:
-            Dictionary with test step request fields
-        """
-        result = {"step": self.step}
-        
-        if self.data is not None:
-            result["data"] = self.data
-            
-        if self.result is not None:
-            result["result"] = self.result
-            
-        return result
-
 
 class ZephyrTestSteps(ApiModel):
     """Collection of test steps for a test case."""
@@ -111,25 +110,8 @@ class ZephyrTestSteps(ApiModel):
         Returns:
             ZephyrTestSteps instance
         """
-        issue_id = kwargs.get("issue_id", "")
-        project_id = kwargs.get("project_id", "")
-        
-        # Extract steps from stepBeanCollection
-        step_data = data.get("stepBeanCollection", [])
-        steps = []
-        
-        for step_info in step_data:
-            try:
-                step = TestStep.from_api_response(step_info)
-                steps.append(step)
-            except Exception:
-                # Skip invalid steps
-                continue
-        
-        return cls(
-            issue_id=issue_id,
-            project_id=project_id,
-            steps=steps,
+        return cls.from_zephyr_response(
+            data, kwargs.get("issue_id", ""), kwargs.get("project_id", "")
         )
 
     @classmethod
@@ -144,7 +126,16 @@ class ZephyrTestSteps(ApiModel):
         Returns:
             ZephyrTestSteps instance
         """
-        return cls.from_api_response(data, issue_id=issue_id, project_id=project_id)
+        # Extract steps from stepBeanCollection
+        step_data = data.get("stepBeanCollection")
+        if not step_data:
+            return cls.from_api_values(issue_id=issue_id, project_id=project_id, steps=[])
+        
+        return cls.from_api_values(
+            issue_id=issue_id,
+            project_id=project_id,
+            steps=[TestStep.from_api_response(step_info) for step_info in step_data],
+        )
 
     def to_simplified_dict(self) -> dict[str, Any]:
         """Convert to simplified dictionary for API responses.
@@ -156,5 +147,5 @@ class ZephyrTestSteps(ApiModel):
             "issue_id": self.issue_id,
             "project_id": self.project_id,
             "total_steps": len(self.steps),
-            "steps": [step.to_simplified_dict() for step in self.steps],
+            "steps": TestStep.to_simplified_list(self.steps),
         } 
\ No newline at end of file
@@ -1,12 +1,14 @@
 """Zephyr test case models."""
 
-from typing import Any
+from typing import Any, ClassVar
+
+from pydantic import Field
 
-from mcp_atlassian.models.base import ApiModel, TimestampMixin
 from mcp_atlassian.models.constants import EMPTY_STRING
+from mcp_atlassian.models.zephyr.common import ZephyrApiModel
 
 
-class ZephyrTestCase(ApiModel, TimestampMixin):
+class ZephyrTestCase(ZephyrApiModel):
     """Model representing a Zephyr test case."""
 
     key: str = EMPTY_STRING
@@ -18,92 +20,63 @@ class ZephyrTestCase(ApiModel, TimestampMixin):
     owner: str | None = None
     estimated_time: int | None = None
     folder: str | None = None
-    labels: list[str] = []
+    labels: list[str] = Field(default_factory=list)
     objective: str | None = None
     precondition: str | None = None
     test_script: dict[str, Any] | None = None
     parameters: dict[str, Any] | None = None
-    custom_fields: dict[str, Any] = {}
-    issue_links: list[str] = []
+    custom_fields: dict[str, Any] = Field(default_factory=dict)
+    issue_links: list[str] = Field(default_factory=list)
     created_on: str = EMPTY_STRING
     last_modified_on: str = EMPTY_STRING
     created_by: str | None = None
     last_modified_by: str | None = None
 
-    @classmethod
-    def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "ZephyrTestCase":
-        """Create ZephyrTestCase from Zephyr API response.
-        
-        Args:
-            data: API response data
-            **kwargs: Additional context parameters
-            
-        Returns:
-            ZephyrTestCase instance
-        """
-        return cls(
-            key=data.get("key", EMPTY_STRING),
-            name=data.get("name", EMPTY_STRING),
-            project_key=data.get("projectKey", EMPTY_STRING),
-            status=data.get("status", EMPTY_STRING),
-            priority=data.get("priority", EMPTY_STRING),
-            component=data.get("component"),
-            owner=data.get("owner"),
-            estimated_time=data.get("estimatedTime"),
-            folder=data.get("folder"),
-            labels=data.get("labels", []),
-            objective=data.get("objective"),
-            precondition=data.get("precondition"),
-            test_script=data.get("testScript"),
-            parameters=data.get("parameters"),
-            custom_fields=data.get("customFields", {}),
-            issue_links=data.get("issueLinks", []),
-            created_on=data.get("createdOn", EMPTY_STRING),
-            last_modified_on=data.get("lastModifiedOn", EMPTY_STRING),
-            created_by=data.get("createdBy"),
-            last_modified_by=data.get("lastModifiedBy"),
-        )
+    # (field name, API key) pairs; missing keys fall back to field defaults
+    _API_FIELDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("key", "key"),
+        ("name", "name"),
+        ("project_key", "projectKey"),
+        ("status", "status"),
+        ("priority", "priority"),
+        ("component", "component"),
+        ("owner", "owner"),
+        ("estimated_time", "estimatedTime"),
+        ("folder", "folder"),
+        ("labels", "labels"),
+        ("objective", "objective"),
+        ("precondition", "precondition"),
+        ("test_script", "testScript"),
+        ("parameters", "parameters"),
+        ("custom_fields", "customFields"),
+        ("issue_links", "issueLinks"),
+        ("created_on", "createdOn"),
+        ("last_modified_on", "lastModifiedOn"),
+        ("created_by", "createdBy"),
+        ("last_modified_by", "lastModifiedBy"),
+    )
 
-    def to_simplified_dict(self) -> dict[str, Any]:
-        """Convert to simplified dictionary for API responses.
-        
-        Returns:
-            Dictionary with essential test case fields
-        """
-        result = {
-            "key": self.key,
-            "name": self.name,
-            "project_key": self.project_key,
-            "status": self.status,
-            "priority": self.priority,
-            "folder": self.folder,
-            "labels": self.labels,
-            "created_on": self.format_timestamp(self.created_on),
-            "last_modified_on": self.format_timestamp(self.last_modified_on),
-        }
-        
-        # Add optional fields if present
-        if self.component:
-            result["component"] = self.component
-        if self.owner:
-            result["owner"] = self.owner
-        if self.estimated_time is not None:
-            result["estimated_time"] = self.estimated_time
-        if self.objective:
-            result["objective"] = self.objective
-        if self.precondition:
-            result["precondition"] = self.precondition
-        if self.test_script:
-            result["test_script"] = self.test_script
-        if self.parameters:
-            result["parameters"] = self.parameters
-        if self.custom_fields:
-            result["custom_fields"] = self.custom_fields
-        if self.issue_links:
-            result["issue_links"] = self.issue_links
-        if self.created_by:
-            result["created_by"] = self.created_by
-        if self.last_modified_by:
-            result["last_modified_by"] = self.last_modified_by
-            
-        return result 
\ No newline at end of file
+    # Field specs for SimplifiedDictMixin.to_simplified_dict
+    _SIMPLIFIED_REQUIRED: ClassVar[tuple[str, ...]] = (
+        "key",
+        "name",
+        "project_key",
+        "status",
+        "priority",
+        "folder",
+        "labels",
+    )
+    _SIMPLIFIED_NOT_NONE: ClassVar[tuple[str, ...]] = ("estimated_time",)
+    _SIMPLIFIED_OPTIONAL: ClassVar[tuple[str, ...]] = (
+        "component",
+        "owner",
+        "estimated_time",
+        "objective",
+        "precondition",
+        "test_script",
+        "parameters",
+        "custom_fields",
+        "issue_links",
+        "created_by",
+        "last_modified_by",
+    )
@@ -1,12 +1,14 @@
 """Zephyr test result models."""
 
-from typing import Any
+from typing import Any, ClassVar
+
+from pydantic import Field
 
-from mcp_atlassian.models.base import ApiModel, TimestampMixin
 from mcp_atlassian.models.constants import EMPTY_STRING
+from mcp_atlassian.models.zephyr.common import ZephyrApiModel
 
 
-class ZephyrTestResult(ApiModel, TimestampMixin):
+class ZephyrTestResult(ZephyrApiModel):
     """Model representing a Zephyr test result."""
 
     id: int | None = None
@@ -19,76 +21,55 @@ class ZephyrTestResult(ApiModel, TimestampMixin):
     actual_end_date: str | None = None
     comment: str | None = None
     test_run_key: str | None = None
-    custom_fields: dict[str, Any] = {}
-    steps: list[dict[str, Any]] = []
-    attachments: list[dict[str, Any]] = []
+    custom_fields: dict[str, Any] = Field(default_factory=dict)
+    steps: list[Any] = Field(default_factory=list)
+    attachments: list[Any] = Field(default_factory=list)
     created_on: str = EMPTY_STRING
     last_modified_on: str = EMPTY_STRING
 
-    @classmethod
-    def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "ZephyrTestResult":
-        """Create ZephyrTestResult from Zephyr API response.
-        
-        Args:
-            data: API response data
-            **kwargs: Additional context parameters
-            
-        Returns:
-            ZephyrTestResult instance
-        """
-        return cls(
-            id=data.get("id"),
-            test_case_key=data.get("testCaseKey", EMPTY_STRING),
-            project_key=data.get("projectKey", EMPTY_STRING),
-            status=data.get("status", EMPTY_STRING),
-            environment=data.get("environment"),
-            executed_by=data.get("executedBy"),
-            actual_start_date=data.get("actualStartDate"),
-            actual_end_date=data.get("actualEndDate"),
-            comment=data.get("comment"),
-            test_run_key=data.get("testRunKey"),
-            custom_fields=data.get("customFields", {}),
-            steps=data.get("steps", []),
-            attachments=data.get("attachments", []),
-            created_on=data.get("createdOn", EMPTY_STRING),
-            last_modified_on=data.get("lastModifiedOn", EMPTY_STRING),
-        )
+    # (field name, API key) pairs; missing keys fall back to field defaults
+    _API_FIELDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("id", "id"),
+        ("test_case_key", "testCaseKey"),
+        ("project_key", "projectKey"),
+        ("status", "status"),
+        ("environment", "environment"),
+        ("executed_by", "executedBy"),
+        ("actual_start_date", "actualStartDate"),
+        ("actual_end_date", "actualEndDate"),
+        ("comment", "comment"),
+        ("test_run_key", "testRunKey"),
+        ("custom_fields", "customFields"),
+        ("steps", "steps"),
+        ("attachments", "attachments"),
+        ("created_on", "createdOn"),
+        ("last_modified_on", "lastModifiedOn"),
+    )
 
-    def to_simplified_dict(self) -> dict[str, Any]:
-        """Convert to simplified dictionary for API responses.
-        
-        Returns:
-            Dictionary with essential test result fields
-        """
-        result = {
-            "test_case_key": self.test_case_key,
-            "project_key": self.project_key,
-            "status": self.status,
-            "executed_by": self.executed_by,
-            "steps_count": len(self.steps),
-            "attachments_count": len(self.attachments),
-            "created_on": self.format_timestamp(self.created_on),
-            "last_modified_on": self.format_timestamp(self.last_modified_on),
-        }
-        
-        # Add optional fields if present
-        if self.id is not None:
-            result["id"] = self.id
-        if self.environment:
-            result["environment"] = self.environment
-        if self.actual_start_date:
-            result["actual_start_date"] = self.format_timestamp(self.actual_start_date)
-        if self.actual_end_date:
-            result["actual_end_date"] = self.format_timestamp(self.actual_end_date)
-        if self.comment:
-            result["comment"] = self.comment
-        if self.test_run_key:
-            result["test_run_key"] = self.test_run_key
-        if self.custom_fields:
-            result["custom_fields"] = self.custom_fields
-        if self.steps:
-            result["steps"] = self.steps
-        if self.attachments:
-            result["attachments"] = self.attachments
-            
-        return result 
\ No newline at end of file
+    # Field specs for SimplifiedDictMixin.to_simplified_dict
+    _SIMPLIFIED_REQUIRED: ClassVar[tuple[str, ...]] = (
+        "test_case_key",
+        "project_key",
+        "status",
+        "executed_by",
+    )
+    _SIMPLIFIED_COUNTS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("steps_count", "steps"),
+        ("attachments_count", "attachments"),
+    )
+    _SIMPLIFIED_NOT_NONE: ClassVar[tuple[str, ...]] = ("id",)
+    _SIMPLIFIED_OPTIONAL_TIMESTAMPS: ClassVar[tuple[str, ...]] = (
+        "actual_start_date",
+        "actual_end_date",
+    )
+    _SIMPLIFIED_OPTIONAL: ClassVar[tuple[str, ...]] = (
+        "id",
+        "environment",
+        "actual_start_date",
+        "actual_end_date",
+        "comment",
+        "test_run_key",
+        "custom_fields",
+        "steps",
+        "attachments",
+    )
@@ -1,12 +1,14 @@
 """Zephyr test run models."""
 
-from typing import Any
+from typing import Any, ClassVar
+
+from pydantic import Field
 
-from mcp_atlassian.models.base import ApiModel, TimestampMixin
 from mcp_atlassian.models.constants import EMPTY_STRING
+from mcp_atlassian.models.zephyr.common import ZephyrApiModel
 
 
-class ZephyrTestRun(ApiModel, TimestampMixin):
+class ZephyrTestRun(ZephyrApiModel):
     """Model representing a Zephyr test run."""
 
     key: str = EMPTY_STRING
@@ -24,97 +26,71 @@ class ZephyrTestRun(ApiModel, TimestampMixin):
     actual_end_date: str | None = None
     test_plan_key: str | None = None
     issue_key: str | None = None
-    items: list[dict[str, Any]] = []
-    custom_fields: dict[str, Any] = {}
-    issue_links: list[str] = []
+    items: list[Any] = Field(default_factory=list)
+    custom_fields: dict[str, Any] = Field(default_factory=dict)
+    issue_links: list[str] = Field(default_factory=list)
     created_on: str = EMPTY_STRING
     last_modified_on: str = EMPTY_STRING
     created_by: str | None = None
     last_modified_by: str | None = None
 
-    @classmethod
-    def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "ZephyrTestRun":
-        """Create ZephyrTestRun from Zephyr API response.
-        
-        Args:
-            data: API response data
-            **kwargs: Additional context parameters
-            
-        Returns:
-            ZephyrTestRun instance
-        """
-        return cls(
-            key=data.get("key", EMPTY_STRING),
-            name=data.get("name", EMPTY_STRING),
-            project_key=data.get("projectKey", EMPTY_STRING),
-            status=data.get("status", EMPTY_STRING),
-            folder=data.get("folder"),
-            owner=data.get("owner"),
-            version=data.get("version"),
-            iteration=data.get("iteration"),
-            environment=data.get("environment"),
-            planned_start_date=data.get("plannedStartDate"),
-            planned_end_date=data.get("plannedEndDate"),
-            actual_start_date=data.get("actualStartDate"),
-            actual_end_date=data.get("actualEndDate"),
-            test_plan_key=data.get("testPlanKey"),
-            issue_key=data.get("issueKey"),
-            items=data.get("items", []),
-            custom_fields=data.get("customFields", {}),
-            issue_links=data.get("issueLinks", []),
-            created_on=data.get("createdOn", EMPTY_STRING),
-            last_modified_on=data.get("lastModifiedOn", EMPTY_STRING),
-            created_by=data.get("createdBy"),
-            last_modified_by=data.get("lastModifiedBy"),
-        )
+    # (field name, API key) pairs; missing keys fall back to field defaults
+    _API_FIELDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("key", "key"),
+        ("name", "name"),
+        ("project_key", "projectKey"),
+        ("status", "status"),
+        ("folder", "folder"),
+        ("owner", "owner"),
+        ("version", "version"),
+        ("iteration", "iteration"),
+        ("environment", "environment"),
+        ("planned_start_date", "plannedStartDate"),
+        ("planned_end_date", "plannedEndDate"),
+        ("actual_start_date", "actualStartDate"),
+        ("actual_end_date", "actualEndDate"),
+        ("test_plan_key", "testPlanKey"),
+        ("issue_key", "issueKey"),
+        ("items", "items"),
+        ("custom_fields", "customFields"),
+        ("issue_links", "issueLinks"),
+        ("created_on", "createdOn"),
+        ("last_modified_on", "lastModifiedOn"),
+        ("created_by", "createdBy"),
+        ("last_modified_by", "lastModifiedBy"),
+    )
 
-    def to_simplified_dict(self) -> dict[str, Any]:
-        """Convert to simplified dictionary for API responses.
-        
-        Returns:
-            Dictionary with essential test run fields
-        """
-        result = {
-            "key": self.key,
-            "name": self.name,
-            "project_key": self.project_key,
-            "status": self.status,
-            "folder": self.folder,
-            "items_count": len(self.items),
-            "created_on": self.format_timestamp(self.created_on),
-            "last_modified_on": self.format_timestamp(self.last_modified_on),
-        }
-        
-        # Add optional fields if present
-        if self.owner:
-            result["owner"] = self.owner
-        if self.version:
-            result["version"] = self.version
-        if self.iteration:
-            result["iteration"] = self.iteration
-        if self.environment:
-            result["environment"] = self.environment
-        if self.planned_start_date:
-            result["planned_start_date"] = self.format_timestamp(self.planned_start_date)
-        if self.planned_end_date:
-            result["planned_end_date"] = self.format_timestamp(self.planned_end_date)
-        if self.actual_start_date:
-            result["actual_start_date"] = self.format_timestamp(self.actual_start_date)
-        if self.actual_end_date:
-            result["actual_end_date"] = self.format_timestamp(self.actual_end_date)
-        if self.test_plan_key:
-            result["test_plan_key"] = self.test_plan_key
-        if self.issue_key:
-            result["issue_key"] = self.issue_key
-        if self.items:
-            result["items"] = self.items
-        if self.custom_fields:
-            result["custom_fields"] = self.custom_fields
-        if self.issue_links:
-            result["issue_links"] = self.issue_links
-        if self.created_by:
-            result["created_by"] = self.created_by
-        if self.last_modified_by:
-            result["last_modified_by"] = self.last_modified_by
-            
-        return result 
\ No newline at end of file
+    # Field specs for SimplifiedDictMixin.to_simplified_dict
+    _SIMPLIFIED_REQUIRED: ClassVar[tuple[str, ...]] = (
+        "key",
+        "name",
+        "project_key",
+        "status",
+        "folder",
+    )
+    _SIMPLIFIED_COUNTS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("items_count", "items"),
+    )
+    _SIMPLIFIED_OPTIONAL_TIMESTAMPS: ClassVar[tuple[str, ...]] = (
+        "planned_start_date",
+        "planned_end_date",
+        "actual_start_date",
+        "actual_end_date",
+    )
+    _SIMPLIFIED_OPTIONAL: ClassVar[tuple[str, ...]] = (
+        "owner",
+        "version",
+        "iteration",
+        "environment",
+        "planned_start_date",
+        "planned_end_date",
+        "actual_start_date",
+        "actual_end_date",
+        "test_plan_key",
+        "issue_key",
+        "items",
+        "custom_fields",
+        "issue_links",
+        "created_by",
+        "last_modified_by",
+    )
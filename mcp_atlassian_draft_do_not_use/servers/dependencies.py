@@ -51,6 +51,11 @@ class ZephyrFetcher(
     pass
 
 
+# Zephyr is configured globally from the environment, so a single fetcher
+# (and its HTTP connection pool) is shared by every tool call
+_zephyr_fetcher: ZephyrFetcher | None = None
+
+
 def _create_user_config_for_fetcher(
     base_config: JiraConfig | ConfluenceConfig,
     auth_type: str,
@@ -411,6 +416,8 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
 async def get_zephyr_fetcher(ctx: Context) -> ZephyrFetcher:
     """Returns a ZephyrFetcher instance for test management operations.
 
+    The fetcher is built on first use and reused for later calls.
+
     Args:
         ctx: The FastMCP context.
 
@@ -420,8 +427,12 @@ async def get_zephyr_fetcher(ctx: Context) -> ZephyrFetcher:
     Raises:
         ValueError: If Zephyr configuration is not available or invalid.
     """
-    logger.debug(f"get_zephyr_fetcher: ENTERED. Context ID: {id(ctx)}")
-    
+    global _zephyr_fetcher
+
+    logger.debug("get_zephyr_fetcher: ENTERED. Context ID: %s", id(ctx))
+    if _zephyr_fetcher is not None:
+        return _zephyr_fetcher
+
     try:
         # Zephyr uses its own authentication system (Bearer token), not user-specific tokens
         # So we always use global configuration from environment
@@ -436,8 +447,25 @@ async def get_zephyr_fetcher(ctx: Context) -> ZephyrFetcher:
         zephyr_fetcher = ZephyrFetcher(config=zephyr_config)
         
         logger.info("get_zephyr_fetcher: Successfully created ZephyrFetcher")
+        _zephyr_fetcher = zephyr_fetcher
         return zephyr_fetcher
         
     except Exception as e:
-        logger.error(f"get_zephyr_fetcher: Failed to create ZephyrFetcher: {e}")
+        logger.error("get_zephyr_fetcher: Failed to create ZephyrFetcher: %s", e)
         raise ValueError(f"Zephyr client (fetcher) not available: {e}")
+
+
+async def close_zephyr_fetcher() -> None:
+    """Close the shared ZephyrFetcher, if one was created, and forget it.
+
+    Called when the server shuts down so the pooled HTTP connections are
+    released; a later get_zephyr_fetcher call builds a new fetcher.
+    """
+    global _zephyr_fetcher
+
+    if _zephyr_fetcher is None:
+        return
+    try:
+        await _zephyr_fetcher.close()
+    finally:
+        _zephyr_fetcher = None
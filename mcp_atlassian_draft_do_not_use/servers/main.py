@@ -19,7 +19,7 @@ from mcp_atlassian.confluence import ConfluenceFetcher
 from mcp_atlassian.confluence.config import ConfluenceConfig
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.config import JiraConfig
-from .dependencies import ZephyrFetcher
+from .dependencies import ZephyrFetcher, close_zephyr_fetcher
 from mcp_atlassian.zephyr.config import ZephyrConfig
 from mcp_atlassian.utils.environment import get_available_services
 from mcp_atlassian.utils.io import is_read_only_mode
@@ -29,7 +29,7 @@ from mcp_atlassian.utils.tools import get_enabled_tools, should_include_tool
 from .confluence import confluence_mcp
 from .context import MainAppContext
 from .jira import jira_mcp
-from .zephyr import zephyr_mcp
+from .zephyr import cancel_background_jobs, zephyr_mcp
 
 logger = logging.getLogger("mcp-atlassian.server.main")
 
@@ -121,6 +121,10 @@ async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
                 logger.debug("Cleaning up Confluence resources...")
             if loaded_zephyr_config:
                 logger.debug("Cleaning up Zephyr resources...")
+            # The shared fetcher is built lazily from the environment, so it
+            # is closed whether or not the lifespan loaded a Zephyr config
+            await cancel_background_jobs()
+            await close_zephyr_fetcher()
         except Exception as e:
             logger.error(f"Error during cleanup: {e}", exc_info=True)
         logger.info("Main Atlassian MCP server lifespan shutdown complete.")
@@ -1,16 +1,33 @@
 """Zephyr FastMCP server instance and tool definitions."""
 
-import json
+import asyncio
+import inspect
 import logging
-from typing import Annotated
+import uuid
+from collections.abc import Awaitable, Callable, Sequence
+from functools import lru_cache, wraps
+from typing import Annotated, Any
 
+from cachetools import TTLCache
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError, MCPAtlassianNotFoundError
-from mcp_atlassian.models.zephyr import TestStepRequest
+from mcp_atlassian.models.zephyr import (
+    EnvironmentCreate,
+    TestCaseCreate,
+    TestCaseUpdate,
+    TestPlanCreate,
+    TestResultCreate,
+    TestRunCreate,
+    TestStep,
+    TestStepRequest,
+    ZephyrApiModel,
+)
 from mcp_atlassian.servers.dependencies import get_zephyr_fetcher
 from mcp_atlassian.utils.decorators import check_write_access
+from mcp_atlassian.utils.env import is_env_truthy
+from mcp_atlassian.utils.serialization import dumps, dumps_pretty
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +36,303 @@ zephyr_mcp = FastMCP(
     description="Provides tools for interacting with Zephyr test management.",
 )
 
+# Tool responses are compact JSON; indentation only costs tokens for the
+# model reading them. Set ZEPHYR_MCP_PRETTY=true for indented output.
+_dump_response = dumps_pretty if is_env_truthy("ZEPHYR_MCP_PRETTY") else dumps
+
+# Compact error envelope; only the message itself needs JSON encoding
+_ERROR_FRAME = '{"success":false,"error":%s}'
+
+
+def _error_response(message: str, **context: Any) -> str:
+    """Serialize a failed tool response.
+
+    Args:
+        message: The error message
+        **context: Extra keys for the response, e.g. the issue_id the call was for
+
+    Returns:
+        JSON string of {"success": false, "error": message, **context}
+    """
+    if context or _dump_response is dumps_pretty:
+        return _dump_response({"success": False, "error": message, **context})
+    return _ERROR_FRAME % dumps(message)
+
+
+# Successful read tool responses, keyed by (tool name, entity key, *arguments);
+# search responses use the query in place of the entity key.
+# Entries expire after a short TTL and are dropped early when a write tool
+# changes the entity. Cache access never awaits, so no lock is needed.
+_response_cache: TTLCache[tuple[Any, ...], str] = TTLCache(maxsize=1024, ttl=30)
+
+
+def _cache_response(cache_key: tuple[Any, ...], response_data: dict[str, Any]) -> str:
+    """Serialize a read tool response, caching it if the call succeeded.
+
+    Args:
+        cache_key: (tool name, entity key, *arguments) for the call
+        response_data: The tool response payload
+
+    Returns:
+        JSON string of the response
+    """
+    response = _dump_response(response_data)
+    if response_data.get("success"):
+        _response_cache[cache_key] = response
+    return response
+
+
+def _dump_model_list(key: str, models: Sequence[ZephyrApiModel]) -> str:
+    """Serialize a success envelope around a list of models item by item.
+
+    Each model is encoded straight to JSON bytes and appended to one buffer,
+    so the list of simplified dicts is never held in memory all at once.
+    Indented output (ZEPHYR_MCP_PRETTY) goes through a single dump instead.
+
+    Args:
+        key: Envelope key for the list (e.g. "test_cases")
+        models: Models to serialize
+
+    Returns:
+        JSON string of {"success": true, key: [...], "count": n}
+    """
+    if _dump_response is dumps_pretty:
+        return dumps_pretty(
+            {
+                "success": True,
+                key: [model.to_simplified_dict() for model in models],
+                "count": len(models),
+            }
+        )
+
+    buf = bytearray(b'{"success":true,"%s":[' % key.encode())
+    for index, model in enumerate(models):
+        if index:
+            buf += b","
+        buf += model.to_json_bytes()
+    buf += b'],"count":%d}' % len(models)
+    return buf.decode("utf-8")
+
+
+# Background jobs started by search tools called with background=True, by job
+# ID. Running jobs are held in a plain dict, which keeps each task referenced
+# until it finishes; when _MAX_RUNNING_JOBS are running the oldest is cancelled
+# to make room. A finished job moves to _finished_jobs, where it is dropped
+# once polled, or after an hour if never polled.
+_MAX_RUNNING_JOBS = 256
+_running_jobs: dict[str, asyncio.Task[str]] = {}
+_finished_jobs: TTLCache[str, asyncio.Task[str]] = TTLCache(maxsize=256, ttl=3600)
+
+
+def _finish_job(job_id: str, task: asyncio.Task[str]) -> None:
+    """Move a finished background job from the running jobs to the results.
+
+    Args:
+        job_id: The job ID
+        task: The finished task
+    """
+    _running_jobs.pop(job_id, None)
+    if task.cancelled():
+        return
+    # Mark a failure as retrieved so the event loop does not report it when
+    # the result is evicted without being polled; poll_job reports it instead
+    task.exception()
+    _finished_jobs[job_id] = task
+
+
+async def cancel_background_jobs() -> None:
+    """Cancel every running background job and wait for the tasks to end.
+
+    Called when the server shuts down.
+    """
+    tasks = list(_running_jobs.values())
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    _running_jobs.clear()
+    _finished_jobs.clear()
+
+
+def _start_search_job(
+    key: str, search: Callable[..., Awaitable[Sequence[ZephyrApiModel]]], *args: Any
+) -> str:
+    """Run a fetcher search as a background task.
+
+    Args:
+        key: Envelope key for the result list (e.g. "test_cases")
+        search: Fetcher search method to call
+        *args: Arguments for the search method
+
+    Returns:
+        The job ID to pass to poll_job
+    """
+
+    async def run() -> str:
+        return _dump_model_list(key, await search(*args))
+
+    if len(_running_jobs) >= _MAX_RUNNING_JOBS:
+        oldest_id = next(iter(_running_jobs))
+        logger.warning("Cancelling background job %s to start a new one", oldest_id)
+        _running_jobs.pop(oldest_id).cancel()
+
+    job_id = uuid.uuid4().hex
+    task = asyncio.create_task(run())
+    _running_jobs[job_id] = task
+    task.add_done_callback(lambda done: _finish_job(job_id, done))
+    return job_id
+
+
+async def _search_response(
+    ctx: Context,
+    tool_name: str,
+    key: str,
+    query: str | None,
+    fields: str | None,
+    start_at: int,
+    max_results: int,
+    background: bool,
+) -> dict[str, Any] | str:
+    """Run a search tool body, serving repeat searches from the response cache.
+
+    Search responses are cached under (tool name, query, fields, start_at,
+    max_results); _invalidate_cached_responses drops them on every write.
+    Background searches always start a new job and are not cached.
+
+    Args:
+        ctx: The FastMCP context
+        tool_name: Search tool name, also the fetcher method to call
+            (e.g. "search_testcases")
+        key: Envelope key for the result list (e.g. "test_cases")
+        query: TQL query string for filtering
+        fields: Comma-separated fields to include in response
+        start_at: Pagination offset (0-based)
+        max_results: Maximum results
+        background: Whether to run the search as a background job
+
+    Returns:
+        The serialized search response, or the job payload for a background
+        search
+    """
+    fields = _parse_fields(fields)
+    cache_key = (tool_name, query, fields, start_at, max_results)
+    if not background and (cached := _response_cache.get(cache_key)) is not None:
+        return cached
+
+    zephyr = await get_zephyr_fetcher(ctx)
+    search = getattr(zephyr, tool_name)
+    if background:
+        job_id = _start_search_job(key, search, query, fields, start_at, max_results)
+        return {"job_id": job_id, "status": "running"}
+    response = _dump_model_list(key, await search(query, fields, start_at, max_results))
+    _response_cache[cache_key] = response
+    return response
+
+
+def _tool_response(
+    action: str, not_found: str | None = None, cached: bool = False
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[str]]]:
+    """Decorator wrapping a tool body in the standard response envelope.
+
+    The decorated coroutine returns the success payload as a dict, which is
+    serialized as {"success": true, **payload}, or an already serialized
+    response string, which is returned as-is. Exceptions become
+    {"success": false, "error": ...} responses.
+
+    Args:
+        action: What the tool does, for the error message (e.g. "get test case")
+        not_found: Entity name reported when MCPAtlassianNotFoundError is raised
+            (e.g. "Test case"); without it the generic error is returned
+        cached: Serve and store successful responses in the response cache,
+            keyed by (tool name, *arguments)
+
+    Returns:
+        The decorator
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[str]]:
+        signature = inspect.signature(func)
+        tool_name = func.__name__
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            if cached:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                # Skip ctx, which is always the first parameter
+                cache_key = (tool_name, *list(bound.arguments.values())[1:])
+                if (response := _response_cache.get(cache_key)) is not None:
+                    return response
+
+            try:
+                payload = await func(*args, **kwargs)
+            except MCPAtlassianNotFoundError as e:
+                if not_found is None:
+                    logger.exception("Error in %s", tool_name)
+                    return _error_response(f"Failed to {action}: {e}")
+                return _error_response(f"{not_found} not found: {e}")
+            except Exception as e:
+                logger.exception("Error in %s", tool_name)
+                return _error_response(f"Failed to {action}: {e}")
+
+            if isinstance(payload, str):
+                response = payload
+            else:
+                response = _dump_response({"success": True, **payload})
+            if cached:
+                _response_cache[cache_key] = response
+            return response
+
+        # FastMCP builds the tool schema from the signature; the wrapper
+        # returns the serialized response rather than the payload dict
+        wrapper.__signature__ = signature.replace(return_annotation=str)  # type: ignore[attr-defined]
+        wrapper.__annotations__ = {**func.__annotations__, "return": str}
+        return wrapper
+
+    return decorator
+
+
+@lru_cache(maxsize=256)
+def _parse_fields(fields: str | None) -> str | None:
+    """Normalize a comma-separated field list passed to a tool.
+
+    Whitespace, empty entries and repeated names are dropped, so spellings
+    such as "key, name" and "key,name" send the same query parameter and
+    share response cache entries. Callers reuse a handful of field lists,
+    so each is only parsed once.
+
+    Args:
+        fields: Comma-separated field names, or None
+
+    Returns:
+        The normalized list, or None if it names no fields
+    """
+    if not fields:
+        return None
+    names = dict.fromkeys(name for name in map(str.strip, fields.split(",")) if name)
+    return ",".join(names) or None
+
+
+def _invalidate_cached_responses(entity_key: str) -> None:
+    """Drop cached read responses for an entity changed by a write tool.
+
+    Cached search results are dropped as well, since any write can change
+    which entities a search matches.
+
+    Args:
+        entity_key: Key or ID of the created, changed or deleted entity
+    """
+    stale = [
+        k for k in list(_response_cache) if k[1] == entity_key or k[0].startswith("search_")
+    ]
+    for cache_key in stale:
+        _response_cache.pop(cache_key, None)
+
 
 # ==================== TEST CASE TOOLS ====================
 
 @zephyr_mcp.tool(tags={"zephyr", "testcase", "read"})
+@_tool_response("get test case", not_found="Test case")
 async def get_testcase(
     ctx: Context,
     test_case_key: Annotated[
@@ -41,7 +351,7 @@ async def get_testcase(
             default=None
         )
     ] = None,
-) -> str:
+) -> dict[str, Any]:
     """Get a test case by key.
     
     Args:
@@ -52,28 +362,21 @@ async def get_testcase(
     Returns:
         JSON string representing the test case data
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        test_case = zephyr.get_testcase(test_case_key, fields)
-        response_data = {"success": True, "test_case": test_case.to_simplified_dict()}
-    except MCPAtlassianNotFoundError as e:
-        response_data = {"success": False, "error": f"Test case not found: {e}"}
-    except Exception as e:
-        logger.exception(f"Error getting test case {test_case_key}")
-        response_data = {"success": False, "error": f"Failed to get test case: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    zephyr = await get_zephyr_fetcher(ctx)
+    test_case = await zephyr.get_testcase(test_case_key, _parse_fields(fields))
+    return {"test_case": test_case.to_simplified_dict()}
 
 
 @zephyr_mcp.tool(tags={"zephyr", "testcase", "write"})
 @check_write_access
+@_tool_response("create test case")
 async def create_testcase(
     ctx: Context,
     testcase_data: Annotated[
-        str,
+        TestCaseCreate,
         Field(
             description=(
-                "JSON string containing test case data. Required: name, projectKey. "
+                "Test case data. Required: name, projectKey. "
                 "Optional fields: status, priority, component, folder, owner, estimatedTime, "
                 "labels, customFields, issueLinks, testScript. "
                 "Status values: 'Draft', 'Approved', 'Deprecated'. "
@@ -82,30 +385,25 @@ async def create_testcase(
             )
         )
     ],
-) -> str:
+) -> dict[str, Any]:
     """Create a new test case.
     
     Args:
         ctx: The FastMCP context
-        testcase_data: JSON string with test case creation data
+        testcase_data: Test case creation data
         
     Returns:
         JSON string with the created test case key
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        data = json.loads(testcase_data)
-        test_case_key = zephyr.create_testcase(data)
-        response_data = {"success": True, "test_case_key": test_case_key}
-    except Exception as e:
-        logger.exception("Error creating test case")
-        response_data = {"success": False, "error": f"Failed to create test case: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    zephyr = await get_zephyr_fetcher(ctx)
+    test_case_key = await zephyr.create_testcase(testcase_data.to_api_payload())
+    _invalidate_cached_responses(test_case_key)
+    return {"test_case_key": test_case_key}
 
 
 @zephyr_mcp.tool(tags={"zephyr", "testcase", "write"})
-@check_write_access  
+@check_write_access
+@_tool_response("update test case", not_found="Test case")
 async def update_testcase(
     ctx: Context,
     test_case_key: Annotated[
@@ -113,10 +411,10 @@ async def update_testcase(
         Field(description="The test case key to update (e.g., 'JQA-T1234')")
     ],
     testcase_data: Annotated[
-        str,
+        TestCaseUpdate,
         Field(
             description=(
-                "JSON string containing updated test case data. "
+                "Updated test case data. "
                 "Available fields: name, status, priority, component, folder, owner, "
                 "estimatedTime, labels, customFields, issueLinks, testScript. "
                 "Note: projectKey cannot be changed. Only fields present will be updated. "
@@ -126,40 +424,33 @@ async def update_testcase(
             )
         )
     ],
-) -> str:
+) -> dict[str, Any]:
     """Update a test case.
     
     Args:
         ctx: The FastMCP context
         test_case_key: The test case key to update
-        testcase_data: JSON string with updated test case data
+        testcase_data: Updated test case data
         
     Returns:
         JSON string indicating success or failure
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        data = json.loads(testcase_data)
-        zephyr.update_testcase(test_case_key, data)
-        response_data = {"success": True, "message": f"Test case {test_case_key} updated"}
-    except MCPAtlassianNotFoundError as e:
-        response_data = {"success": False, "error": f"Test case not found: {e}"}
-    except Exception as e:
-        logger.exception(f"Error updating test case {test_case_key}")
-        response_data = {"success": False, "error": f"Failed to update test case: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    zephyr = await get_zephyr_fetcher(ctx)
+    await zephyr.update_testcase(test_case_key, testcase_data.to_api_payload())
+    _invalidate_cached_responses(test_case_key)
+    return {"message": f"Test case {test_case_key} updated"}
 
 
 @zephyr_mcp.tool(tags={"zephyr", "testcase", "write"})
 @check_write_access
+@_tool_response("delete test case", not_found="Test case")
 async def delete_testcase(
     ctx: Context,
     test_case_key: Annotated[
         str,
         Field(description="The test case key to delete (e.g., 'JQA-T1234')")
     ],
-) -> str:
+) -> dict[str, Any]:
     """Delete a test case.
     
     Args:
@@ -169,20 +460,14 @@ async def delete_testcase(
     Returns:
         JSON string indicating success or failure
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        zephyr.delete_testcase(test_case_key)
-        response_data = {"success": True, "message": f"Test case {test_case_key} deleted"}
-    except MCPAtlassianNotFoundError as e:
-        response_data = {"success": False, "error": f"Test case not found: {e}"}
-    except Exception as e:
-        logger.exception(f"Error deleting test case {test_case_key}")
-        response_data = {"success": False, "error": f"Failed to delete test case: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    zephyr = await get_zephyr_fetcher(ctx)
+    await zephyr.delete_testcase(test_case_key)
+    _invalidate_cached_responses(test_case_key)
+    return {"message": f"Test case {test_case_key} deleted"}
 
 
 @zephyr_mcp.tool(tags={"zephyr", "testcase", "search"})
+@_tool_response("search test cases")
 async def search_testcases(
     ctx: Context,
     query: Annotated[
@@ -232,7 +517,17 @@ async def search_testcases(
             le=200
         )
     ] = 200,
-) -> str:
+    background: Annotated[
+        bool,
+        Field(
+            description=(
+                "Run the search as a background job and return a job_id immediately. "
+                "Use poll_job to fetch the result. Useful for large result sets."
+            ),
+            default=False,
+        )
+    ] = False,
+) -> dict[str, Any] | str:
     """Search for test cases using TQL query.
     
     Args:
@@ -241,25 +536,20 @@ async def search_testcases(
         fields: Optional fields to include in response
         start_at: Pagination offset (0-based)
         max_results: Maximum results (1-200)
+        background: Whether to run the search as a background job
         
     Returns:
         JSON string with search results including test cases array and count
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        test_cases = zephyr.search_testcases(query, fields, start_at, max_results)
-        results = [tc.to_simplified_dict() for tc in test_cases]
-        response_data = {"success": True, "test_cases": results, "count": len(results)}
-    except Exception as e:
-        logger.exception("Error searching test cases")
-        response_data = {"success": False, "error": f"Failed to search test cases: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    return await _search_response(
+        ctx, "search_testcases", "test_cases", query, fields, start_at, max_results, background
+    )
 
 
 # ==================== TEST PLAN TOOLS ====================
 
 @zephyr_mcp.tool(tags={"zephyr", "testplan", "read"})
+@_tool_response("get test plan", not_found="Test plan")
 async def get_testplan(
     ctx: Context,
     test_plan_key: Annotated[
@@ -277,7 +567,7 @@ async def get_testplan(
             default=None
         )
     ] = None,
-) -> str:
+) -> dict[str, Any]:
     """Get a test plan by key.
     
     Args:
@@ -288,57 +578,45 @@ async def get_testplan(
     Returns:
         JSON string representing the test plan data
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        test_plan = zephyr.get_testplan(test_plan_key, fields)
-        response_data = {"success": True, "test_plan": test_plan.to_simplified_dict()}
-    except MCPAtlassianNotFoundError as e:
-        response_data = {"success": False, "error": f"Test plan not found: {e}"}
-    except Exception as e:
-        logger.exception(f"Error getting test plan {test_plan_key}")
-        response_data = {"success": False, "error": f"Failed to get test plan: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    zephyr = await get_zephyr_fetcher(ctx)
+    test_plan = await zephyr.get_testplan(test_plan_key, _parse_fields(fields))
+    return {"test_plan": test_plan.to_simplified_dict()}
 
 
 @zephyr_mcp.tool(tags={"zephyr", "testplan", "write"})
 @check_write_access
+@_tool_response("create test plan")
 async def create_testplan(
     ctx: Context,
     testplan_data: Annotated[
-        str,
+        TestPlanCreate,
         Field(
             description=(
-                "JSON string containing test plan data. Required: name, projectKey. "
+                "Test plan data. Required: name, projectKey. "
                 "Optional fields: status, objective, folder, labels, customFields. "
                 "Example: {\"name\": \"Sprint 1 Test Plan\", \"projectKey\": \"JQA\", "
                 "\"objective\": \"Test user authentication features\"}"
             )
         )
     ],
-) -> str:
+) -> dict[str, Any]:
     """Create a new test plan.
     
     Args:
         ctx: The FastMCP context
-        testplan_data: JSON string with test plan creation data
+        testplan_data: Test plan creation data
         
     Returns:
         JSON string with the created test plan key
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        data = json.loads(testplan_data)
-        test_plan_key = zephyr.create_testplan(data)
-        response_data = {"success": True, "test_plan_key": test_plan_key}
-    except Exception as e:
-        logger.exception("Error creating test plan")
-        response_data = {"success": False, "error": f"Failed to create test plan: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    zephyr = await get_zephyr_fetcher(ctx)
+    test_plan_key = await zephyr.create_testplan(testplan_data.to_api_payload())
+    _invalidate_cached_responses(test_plan_key)
+    return {"test_plan_key": test_plan_key}
 
 
 @zephyr_mcp.tool(tags={"zephyr", "testplan", "search"})
+@_tool_response("search test plans")
 async def search_testplans(
     ctx: Context,
     query: Annotated[
@@ -385,7 +663,17 @@ async def search_testplans(
             le=200
         )
     ] = 200,
-) -> str:
+    background: Annotated[
+        bool,
+        Field(
+            description=(
+                "Run the search as a background job and return a job_id immediately. "
+                "Use poll_job to fetch the result. Useful for large result sets."
+            ),
+            default=False,
+        )
+    ] = False,
+) -> dict[str, Any] | str:
     """Search for test plans using TQL query.
     
     Args:
@@ -394,25 +682,20 @@ async def search_testplans(
         fields: Optional fields to include
         start_at: Pagination offset
         max_results: Maximum results
+        background: Whether to run the search as a background job
         
     Returns:
         JSON string with search results
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        test_plans = zephyr.search_testplans(query, fields, start_at, max_results)
-        results = [tp.to_simplified_dict() for tp in test_plans]
-        response_data = {"success": True, "test_plans": results, "count": len(results)}
-    except Exception as e:
-        logger.exception("Error searching test plans")
-        response_data = {"success": False, "error": f"Failed to search test plans: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    return await _search_response(
+        ctx, "search_testplans", "test_plans", query, fields, start_at, max_results, background
+    )
 
 
 # ==================== TEST RUN TOOLS ====================
 
 @zephyr_mcp.tool(tags={"zephyr", "testrun", "read"})
+@_tool_response("get test run", not_found="Test run")
 async def get_testrun(
     ctx: Context,
     test_run_key: Annotated[
@@ -431,7 +714,7 @@ async def get_testrun(
             default=None
         )
     ] = None,
-) -> str:
+) -> dict[str, Any]:
     """Get a test run by key.
     
     Args:
@@ -442,28 +725,21 @@ async def get_testrun(
     Returns:
         JSON string representing the test run data
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        test_run = zephyr.get_testrun(test_run_key, fields)
-        response_data = {"success": True, "test_run": test_run.to_simplified_dict()}
-    except MCPAtlassianNotFoundError as e:
-        response_data = {"success": False, "error": f"Test run not found: {e}"}
-    except Exception as e:
-        logger.exception(f"Error getting test run {test_run_key}")
-        response_data = {"success": False, "error": f"Failed to get test run: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    zephyr = await get_zephyr_fetcher(ctx)
+    test_run = await zephyr.get_testrun(test_run_key, _parse_fields(fields))
+    return {"test_run": test_run.to_simplified_dict()}
 
 
 @zephyr_mcp.tool(tags={"zephyr", "testrun", "write"})
 @check_write_access
+@_tool_response("create test run")
 async def create_testrun(
     ctx: Context,
     testrun_data: Annotated[
-        str,
+        TestRunCreate,
         Field(
             description=(
-                "JSON string containing test run data. Required: name, projectKey. "
+                "Test run data. Required: name, projectKey. "
                 "Optional fields: plannedStartDate, plannedEndDate, testPlanKey, issueKey, "
                 "version, iteration, items (test cases), customFields. "
                 "Status values: 'Not Executed', 'In Progress', 'Done'. "
@@ -472,29 +748,24 @@ async def create_testrun(
             )
         )
     ],
-) -> str:
+) -> dict[str, Any]:
     """Create a new test run.
     
     Args:
         ctx: The FastMCP context
-        testrun_data: JSON string with test run creation data
+        testrun_data: Test run creation data
         
     Returns:
         JSON string with the created test run key
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        data = json.loads(testrun_data)
-        test_run_key = zephyr.create_testrun(data)
-        response_data = {"success": True, "test_run_key": test_run_key}
-    except Exception as e:
-        logger.exception("Error creating test run")
-        response_data = {"success": False, "error": f"Failed to create test run: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    zephyr = await get_zephyr_fetcher(ctx)
+    test_run_key = await zephyr.create_testrun(testrun_data.to_api_payload())
+    _invalidate_cached_responses(test_run_key)
+    return {"test_run_key": test_run_key}
 
 
 @zephyr_mcp.tool(tags={"zephyr", "testrun", "search"})
+@_tool_response("search test runs")
 async def search_testruns(
     ctx: Context,
     query: Annotated[
@@ -541,7 +812,17 @@ async def search_testruns(
             le=200
         )
     ] = 200,
-) -> str:
+    background: Annotated[
+        bool,
+        Field(
+            description=(
+                "Run the search as a background job and return a job_id immediately. "
+                "Use poll_job to fetch the result. Useful for large result sets."
+            ),
+            default=False,
+        )
+    ] = False,
+) -> dict[str, Any] | str:
     """Search for test runs using TQL query.
     
     Args:
@@ -550,33 +831,64 @@ async def search_testruns(
         fields: Optional fields to include
         start_at: Pagination offset
         max_results: Maximum results
+        background: Whether to run the search as a background job
         
     Returns:
         JSON string with search results
     """
+    return await _search_response(
+        ctx, "search_testruns", "test_runs", query, fields, start_at, max_results, background
+    )
+
+
+# ==================== JOB TOOLS ====================
+
+@zephyr_mcp.tool(tags={"zephyr", "read"})
+async def poll_job(
+    ctx: Context,
+    job_id: Annotated[
+        str,
+        Field(description="Job ID returned by a search tool called with background=True")
+    ],
+) -> str:
+    """Get the status or result of a background job.
+    
+    Args:
+        ctx: The FastMCP context
+        job_id: The job ID
+        
+    Returns:
+        JSON string with the job status, or the job's result once it is done
+    """
+    task = _running_jobs.get(job_id) or _finished_jobs.get(job_id)
+    if task is None:
+        return _error_response(f"Unknown job: {job_id}")
+    if not task.done():
+        return _dump_response({"success": True, "job_id": job_id, "status": "running"})
+
+    _running_jobs.pop(job_id, None)
+    _finished_jobs.pop(job_id, None)
+    if task.cancelled():
+        return _error_response("Job was cancelled", job_id=job_id)
     try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        test_runs = zephyr.search_testruns(query, fields, start_at, max_results)
-        results = [tr.to_simplified_dict() for tr in test_runs]
-        response_data = {"success": True, "test_runs": results, "count": len(results)}
+        return task.result()
     except Exception as e:
-        logger.exception("Error searching test runs")
-        response_data = {"success": False, "error": f"Failed to search test runs: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+        logger.exception("Background job %s failed", job_id)
+        return _error_response(f"Job failed: {e}", job_id=job_id)
 
 
 # ==================== TEST RESULT TOOLS ====================
 
 @zephyr_mcp.tool(tags={"zephyr", "testresult", "write"})
 @check_write_access
+@_tool_response("create test result")
 async def create_testresult(
     ctx: Context,
     testresult_data: Annotated[
-        str,
+        TestResultCreate,
         Field(
             description=(
-                "JSON string containing test result data. Required: testCaseKey. "
+                "Test result data. Required: testCaseKey. "
                 "Optional fields: status, actualStartDate, actualEndDate, comment, "
                 "executedBy, environment, customFields. "
                 "Status values: 'Not Executed', 'In Progress', 'Pass', 'Fail', 'Blocked'. "
@@ -584,36 +896,31 @@ async def create_testresult(
             )
         )
     ],
-) -> str:
+) -> dict[str, Any]:
     """Create a new test result for a test case.
     
     Args:
         ctx: The FastMCP context
-        testresult_data: JSON string with test result creation data
+        testresult_data: Test result creation data
         
     Returns:
         JSON string with the created test result ID
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        data = json.loads(testresult_data)
-        test_result_id = zephyr.create_testresult(data)
-        response_data = {"success": True, "test_result_id": test_result_id}
-    except Exception as e:
-        logger.exception("Error creating test result")
-        response_data = {"success": False, "error": f"Failed to create test result: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    zephyr = await get_zephyr_fetcher(ctx)
+    test_result_id = await zephyr.create_testresult(testresult_data.to_api_payload())
+    _invalidate_cached_responses(testresult_data.test_case_key)
+    return {"test_result_id": test_result_id}
 
 
 @zephyr_mcp.tool(tags={"zephyr", "testresult", "read"})
+@_tool_response("get latest test result", cached=True)
 async def get_testcase_latest_result(
     ctx: Context,
     test_case_key: Annotated[
         str,
         Field(description="The test case key (e.g., 'JQA-T1234')")
     ],
-) -> str:
+) -> dict[str, Any]:
     """Get the latest test result for a test case.
     
     Args:
@@ -623,28 +930,22 @@ async def get_testcase_latest_result(
     Returns:
         JSON string with the latest test result data
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        test_result = zephyr.get_testcase_latest_result(test_case_key)
-        if test_result:
-            response_data = {"success": True, "test_result": test_result.to_simplified_dict()}
-        else:
-            response_data = {"success": True, "test_result": None, "message": "No results found"}
-    except Exception as e:
-        logger.exception(f"Error getting latest result for test case {test_case_key}")
-        response_data = {"success": False, "error": f"Failed to get latest test result: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    zephyr = await get_zephyr_fetcher(ctx)
+    test_result = await zephyr.get_testcase_latest_result(test_case_key)
+    if test_result:
+        return {"test_result": test_result.to_simplified_dict()}
+    return {"test_result": None, "message": "No results found"}
 
 
 @zephyr_mcp.tool(tags={"zephyr", "testresult", "read"})
+@_tool_response("get test run results", not_found="Test run")
 async def get_testrun_results(
     ctx: Context,
     test_run_key: Annotated[
         str,
         Field(description="The test run key (e.g., 'JQA-R1234')")
     ],
-) -> str:
+) -> dict[str, Any] | str:
     """Get all test results for a test run.
     
     Args:
@@ -654,18 +955,9 @@ async def get_testrun_results(
     Returns:
         JSON string with all test results for the test run
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        test_results = zephyr.get_testrun_results(test_run_key)
-        results = [tr.to_simplified_dict() for tr in test_results]
-        response_data = {"success": True, "test_results": results, "count": len(results)}
-    except MCPAtlassianNotFoundError as e:
-        response_data = {"success": False, "error": f"Test run not found: {e}"}
-    except Exception as e:
-        logger.exception(f"Error getting test results for test run {test_run_key}")
-        response_data = {"success": False, "error": f"Failed to get test run results: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    zephyr = await get_zephyr_fetcher(ctx)
+    test_results = await zephyr.get_testrun_results(test_run_key)
+    return _dump_model_list("test_results", test_results)
 
 
 # ==================== ORIGINAL TEST STEP TOOLS ====================
@@ -699,6 +991,10 @@ async def get_test_steps(
     Raises:
         ValueError: If the Zephyr client is not configured or available.
     """
+    cache_key = ("get_test_steps", issue_id, project_id)
+    if (cached := _response_cache.get(cache_key)) is not None:
+        return cached
+
     try:
         zephyr = await get_zephyr_fetcher(ctx)
         test_steps = await zephyr.get_test_steps(issue_id, project_id)
@@ -718,22 +1014,18 @@ async def get_test_steps(
                 "An unexpected error occurred while fetching test steps."
             )
             logger.exception(
-                f"Unexpected error in get_test_steps for issue '{issue_id}':"
+                "Unexpected error in get_test_steps for issue '%s':", issue_id
             )
         
-        error_result = {
-            "success": False,
-            "error": str(e),
-            "issue_id": issue_id,
-            "project_id": project_id,
-        }
         logger.log(
             log_level,
-            f"get_test_steps failed for issue '{issue_id}': {error_message}",
+            "get_test_steps failed for issue '%s': %s",
+            issue_id,
+            error_message,
         )
-        response_data = error_result
+        return _error_response(str(e), issue_id=issue_id, project_id=project_id)
     
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    return _cache_response(cache_key, response_data)
 
 
 @zephyr_mcp.tool(tags={"zephyr", "write"})
@@ -799,6 +1091,7 @@ async def add_test_step(
         )
         
         test_step = await zephyr.add_test_step(issue_id, project_id, step_request)
+        _invalidate_cached_responses(issue_id)
         result_data = test_step.to_simplified_dict()
         
         response_data = {
@@ -818,22 +1111,18 @@ async def add_test_step(
                 "An unexpected error occurred while adding the test step."
             )
             logger.exception(
-                f"Unexpected error in add_test_step for issue '{issue_id}':"
+                "Unexpected error in add_test_step for issue '%s':", issue_id
             )
         
-        error_result = {
-            "success": False,
-            "error": str(e),
-            "issue_id": issue_id,
-            "project_id": project_id,
-        }
         logger.log(
             log_level,
-            f"add_test_step failed for issue '{issue_id}': {error_message}",
+            "add_test_step failed for issue '%s': %s",
+            issue_id,
+            error_message,
         )
-        response_data = error_result
+        return _error_response(str(e), issue_id=issue_id, project_id=project_id)
     
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    return _dump_response(response_data)
 
 
 @zephyr_mcp.tool(tags={"zephyr", "write"})
@@ -853,10 +1142,10 @@ async def add_multiple_test_steps(
         ),
     ],
     steps: Annotated[
-        str,
+        list[TestStepRequest],
         Field(
             description=(
-                "JSON array of test step objects. Each object should contain:\n"
+                "List of test step objects. Each object should contain:\n"
                 "- step (required): Description of the test step\n"
                 "- data (optional): Test data or input for this step\n"
                 "- result (optional): Expected result for this step\n"
@@ -871,7 +1160,7 @@ async def add_multiple_test_steps(
         ctx: The FastMCP context.
         issue_id: JIRA issue ID (numeric)
         project_id: JIRA project ID (numeric)
-        steps: JSON array of test step objects
+        steps: Test step objects to add
 
     Returns:
         JSON string representing the results of adding multiple test steps.
@@ -879,57 +1168,33 @@ async def add_multiple_test_steps(
     Raises:
         ValueError: If the Zephyr client is not configured or available.
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        
-        # Parse the steps JSON
-        try:
-            steps_data = json.loads(steps)
-        except json.JSONDecodeError as e:
-            return json.dumps({
-                "success": False,
-                "error": f"Invalid JSON format for steps: {e}",
-                "issue_id": issue_id,
-                "project_id": project_id,
-            }, indent=2, ensure_ascii=False)
-        
-        if not isinstance(steps_data, list):
-            return json.dumps({
-                "success": False,
-                "error": "Steps must be a JSON array",
+    if not steps:
+        return _dump_response(
+            {
+                "success": True,
+                "test_steps": [],
+                "total_requested": 0,
+                "total_created": 0,
                 "issue_id": issue_id,
                 "project_id": project_id,
-            }, indent=2, ensure_ascii=False)
-        
-        # Create TestStepRequest objects
-        step_requests = []
-        for i, step_data in enumerate(steps_data):
-            try:
-                step_request = TestStepRequest(
-                    step=step_data.get("step", ""),
-                    data=step_data.get("data"),
-                    result=step_data.get("result"),
-                )
-                step_requests.append(step_request)
-            except Exception as e:
-                return json.dumps({
-                    "success": False,
-                    "error": f"Invalid step data at index {i}: {e}",
-                    "issue_id": issue_id,
-                    "project_id": project_id,
-                }, indent=2, ensure_ascii=False)
+            }
+        )
+
+    try:
+        zephyr = await get_zephyr_fetcher(ctx)
         
         # Add all test steps
         created_steps = await zephyr.add_multiple_test_steps(
-            issue_id, project_id, step_requests
+            issue_id, project_id, steps
         )
+        _invalidate_cached_responses(issue_id)
         
-        result_data = [step.to_simplified_dict() for step in created_steps]
+        result_data = TestStep.to_simplified_list(created_steps)
         
         response_data = {
             "success": True,
             "test_steps": result_data,
-            "total_requested": len(step_requests),
+            "total_requested": len(steps),
             "total_created": len(created_steps),
             "issue_id": issue_id,
             "project_id": project_id,
@@ -945,34 +1210,31 @@ async def add_multiple_test_steps(
                 "An unexpected error occurred while adding test steps."
             )
             logger.exception(
-                f"Unexpected error in add_multiple_test_steps for issue '{issue_id}':"
+                "Unexpected error in add_multiple_test_steps for issue '%s':", issue_id
             )
         
-        error_result = {
-            "success": False,
-            "error": str(e),
-            "issue_id": issue_id,
-            "project_id": project_id,
-        }
         logger.log(
             log_level,
-            f"add_multiple_test_steps failed for issue '{issue_id}': {error_message}",
+            "add_multiple_test_steps failed for issue '%s': %s",
+            issue_id,
+            error_message,
         )
-        response_data = error_result
+        return _error_response(str(e), issue_id=issue_id, project_id=project_id)
     
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    return _dump_response(response_data)
 
 
 # ==================== ENVIRONMENT TOOLS ====================
 
 @zephyr_mcp.tool(tags={"zephyr", "environment", "read"})
+@_tool_response("get environments")
 async def get_environments(
     ctx: Context,
     project_key: Annotated[
         str,
         Field(description="The project key to get environments for (e.g., 'JQA')")
     ],
-) -> str:
+) -> dict[str, Any]:
     """Get all environments for a project.
     
     Args:
@@ -982,56 +1244,46 @@ async def get_environments(
     Returns:
         JSON string with list of environments for the project
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        environments = zephyr.get_environments(project_key)
-        response_data = {"success": True, "environments": environments, "count": len(environments)}
-    except Exception as e:
-        logger.exception(f"Error getting environments for project {project_key}")
-        response_data = {"success": False, "error": f"Failed to get environments: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    zephyr = await get_zephyr_fetcher(ctx)
+    environments = await zephyr.get_environments(project_key)
+    return {"environments": environments, "count": len(environments)}
 
 
 @zephyr_mcp.tool(tags={"zephyr", "environment", "write"})
 @check_write_access
+@_tool_response("create environment")
 async def create_environment(
     ctx: Context,
     environment_data: Annotated[
-        str,
+        EnvironmentCreate,
         Field(
             description=(
-                "JSON string containing environment data. Required: name, projectKey. "
+                "Environment data. Required: name, projectKey. "
                 "Optional fields: description. Environment name must be unique per project. "
                 "Example: {\"name\": \"Production\", \"projectKey\": \"JQA\", \"description\": \"Production environment\"}"
             )
         )
     ],
-) -> str:
+) -> dict[str, Any]:
     """Create a new environment for a project.
     
     Args:
         ctx: The FastMCP context
-        environment_data: JSON string with environment creation data
+        environment_data: Environment creation data
         
     Returns:
         JSON string with the created environment ID
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        data = json.loads(environment_data)
-        environment_id = zephyr.create_environment(data)
-        response_data = {"success": True, "environment_id": environment_id}
-    except Exception as e:
-        logger.exception("Error creating environment")
-        response_data = {"success": False, "error": f"Failed to create environment: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    zephyr = await get_zephyr_fetcher(ctx)
+    environment_id = await zephyr.create_environment(environment_data.to_api_payload())
+    _invalidate_cached_responses(str(environment_id))
+    return {"environment_id": environment_id}
 
 
 # ==================== ISSUE LINK TOOLS ====================
 
 @zephyr_mcp.tool(tags={"zephyr", "issuelink", "read"})
+@_tool_response("get test cases for issue")
 async def get_issue_testcases(
     ctx: Context,
     issue_key: Annotated[
@@ -1061,13 +1313,6 @@ async def get_issue_testcases(
     Returns:
         JSON string with list of test cases linked to the issue
     """
-    try:
-        zephyr = await get_zephyr_fetcher(ctx)
-        test_cases = zephyr.get_issue_testcases(issue_key, fields)
-        results = [tc.to_simplified_dict() for tc in test_cases] if test_cases else []
-        response_data = {"success": True, "test_cases": results, "count": len(results)}
-    except Exception as e:
-        logger.exception(f"Error getting test cases for issue {issue_key}")
-        response_data = {"success": False, "error": f"Failed to get test cases for issue: {e}"}
-    
-    return json.dumps(response_data, indent=2, ensure_ascii=False) 
\ No newline at end of file
+    zephyr = await get_zephyr_fetcher(ctx)
+    test_cases = await zephyr.get_issue_testcases(issue_key, _parse_fields(fields))
+    return _dump_model_list("test_cases", test_cases or [])
@@ -0,0 +1,86 @@
+"""JSON serialization helpers for MCP Atlassian.
+
+orjson is used when it is installed; otherwise these helpers fall back to
+the standard library json module with equivalent output.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+# Stdlib fallback codecs, built once: json.dumps constructs a new
+# JSONEncoder on every call that passes options
+_encode_compact = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_encode_pretty = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+_decode = json.JSONDecoder().decode
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 encoded JSON.
+
+    Non-string dict keys are converted to strings, as json.dumps does.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        The JSON document as UTF-8 bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return _encode_compact(obj).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        The JSON document without insignificant whitespace
+    """
+    return dumps_bytes(obj).decode("utf-8")
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize an object to a JSON string indented by two spaces.
+
+    Non-ASCII characters are written as-is, matching
+    json.dumps(obj, indent=2, ensure_ascii=False).
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        The indented JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode(
+            "utf-8"
+        )
+    return _encode_pretty(obj)
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        The decoded object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+            (orjson.JSONDecodeError subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return _decode(data)
@@ -1,5 +1,6 @@
 """Zephyr package for test management integration."""
 
+from .batching import BatchingTestResultWriter
 from .client import ZephyrClient
 from .config import ZephyrConfig
 from .testcase import ZephyrTestCaseMixin
@@ -8,6 +9,7 @@ from .testresult import ZephyrTestResultMixin
 from .testrun import ZephyrTestRunMixin
 
 __all__ = [
+    "BatchingTestResultWriter",
     "ZephyrClient",
     "ZephyrConfig",
     "ZephyrTestCaseMixin",
@@ -21,13 +21,12 @@ class ZephyrAuth:
         """
         self.config = config
 
-    def get_auth_headers(self, method: str, url: str) -> dict[str, str]:
-        """Get authentication headers for Zephyr API request.
+    def get_default_headers(self) -> dict[str, str]:
+        """Get the authentication headers sent with every Zephyr API request.
+        
+        Bearer authentication does not depend on the request, so the HTTP
+        client sets these once as its default headers.
         
-        Args:
-            method: HTTP method (GET, POST, etc.) - not used for Bearer auth but kept for compatibility
-            url: API endpoint URL - not used for Bearer auth but kept for compatibility
-            
         Returns:
             Dictionary of headers including Authorization
             
@@ -44,6 +43,21 @@ class ZephyrAuth:
             "Content-Type": "application/json",
         }
 
+    def get_auth_headers(self, method: str, url: str) -> dict[str, str]:
+        """Get authentication headers for Zephyr API request.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.) - not used for Bearer auth but kept for compatibility
+            url: API endpoint URL - not used for Bearer auth but kept for compatibility
+            
+        Returns:
+            Dictionary of headers including Authorization
+            
+        Raises:
+            MCPAtlassianAuthenticationError: If API token is not configured
+        """
+        return self.get_default_headers()
+
     def validate_token_format(self) -> bool:
         """Validate that the API token has a reasonable format.
         
@@ -0,0 +1,152 @@
+"""Coalescing writer for Zephyr test run results."""
+
+import asyncio
+import logging
+from typing import Any
+
+from mcp_atlassian.exceptions import MCPAtlassianBulkCreateError
+from mcp_atlassian.zephyr.protocols import ZephyrTestResultOperationsProto
+
+logger = logging.getLogger("mcp-atlassian.zephyr.batching")
+
+# (test run key, environment, user key) shared by every result in a batch
+BatchKey = tuple[str, str | None, str | None]
+
+
+class BatchingTestResultWriter:
+    """Coalesce per-case test run results into bulk create requests.
+
+    Results submitted for the same test run, environment and user are
+    buffered and sent together through create_bulk_testrun_results, one
+    POST per batch instead of one per test case. A batch is sent once it
+    holds max_batch results or flush_interval seconds after its first
+    result, whichever comes first.
+
+    Each batch succeeds or fails as a whole: if its request fails, or the
+    server returns fewer IDs than results, every result in the batch gets
+    the same exception.
+
+    Used as an async context manager, the writer flushes every pending
+    batch on exit:
+
+        async with BatchingTestResultWriter(fetcher) as writer:
+            ids = await asyncio.gather(
+                *(writer.create_testrun_result(run, case, data) for case, data in results)
+            )
+    """
+
+    def __init__(
+        self,
+        fetcher: ZephyrTestResultOperationsProto,
+        max_batch: int = 200,
+        flush_interval: float = 0.2,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            fetcher: Zephyr fetcher providing create_bulk_testrun_results
+            max_batch: Number of results that triggers an immediate send
+            flush_interval: Seconds a batch waits for more results
+        """
+        self._fetcher = fetcher
+        self._max_batch = max_batch
+        self._flush_interval = flush_interval
+        self._pending: dict[BatchKey, list[tuple[dict[str, Any], asyncio.Future[int]]]] = {}
+        self._timers: dict[BatchKey, asyncio.TimerHandle] = {}
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    async def __aenter__(self) -> "BatchingTestResultWriter":
+        """Return the writer itself."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Send every batch still pending."""
+        await self.flush()
+
+    async def create_testrun_result(
+        self,
+        test_run_key: str,
+        test_case_key: str,
+        testresult_data: dict[str, Any],
+        environment: str | None = None,
+        user_key: str | None = None,
+    ) -> int:
+        """Queue a test result and wait for the batch containing it.
+
+        Args:
+            test_run_key: The test run key
+            test_case_key: The test case key
+            testresult_data: Test result data
+            environment: Optional environment filter
+            user_key: Optional user key filter
+
+        Returns:
+            ID of the created test result
+
+        Raises:
+            MCPAtlassianBulkCreateError: If the server returned fewer IDs
+                than results in the batch; created_ids holds the IDs it did
+                return
+            MCPAtlassianError: If the batch request failed
+        """
+        key = (test_run_key, environment, user_key)
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        batch = self._pending.setdefault(key, [])
+        batch.append(({"testCaseKey": test_case_key, **testresult_data}, future))
+
+        if len(batch) >= self._max_batch:
+            self._start_flush(key)
+        elif key not in self._timers:
+            self._timers[key] = asyncio.get_running_loop().call_later(
+                self._flush_interval, self._start_flush, key
+            )
+        return await future
+
+    async def flush(self) -> None:
+        """Send every buffered batch and wait for all sends to finish."""
+        for key in list(self._pending):
+            self._start_flush(key)
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _start_flush(self, key: BatchKey) -> None:
+        """Take the batch for a key out of the buffer and send it in a task."""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        task = asyncio.create_task(self._send(key, batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _send(
+        self, key: BatchKey, batch: list[tuple[dict[str, Any], asyncio.Future[int]]]
+    ) -> None:
+        """Create one batch and resolve its futures with the returned IDs.
+
+        IDs are matched to results by position, as the bulk endpoint returns
+        them in request order.
+        """
+        test_run_key, environment, user_key = key
+        try:
+            ids = await self._fetcher.create_bulk_testrun_results(
+                test_run_key, [payload for payload, _ in batch], environment, user_key
+            )
+            if len(ids) != len(batch):
+                raise MCPAtlassianBulkCreateError(
+                    f"Bulk create for {test_run_key} returned {len(ids)} IDs "
+                    f"for {len(batch)} results",
+                    created_ids=list(ids),
+                )
+        except Exception as e:
+            logger.error("Failed to send %s test results for %s: %s", len(batch), test_run_key, e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result_id in zip(batch, ids):
+            if not future.done():
+                future.set_result(result_id)
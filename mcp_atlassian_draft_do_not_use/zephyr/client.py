@@ -1,21 +1,86 @@
 """Base client module for Zephyr API interactions."""
 
+import asyncio
+import gzip
 import logging
-import os
-from typing import Any
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from functools import wraps
+from importlib.util import find_spec
+from typing import Any, ParamSpec, TypeVar
+from urllib.request import getproxies
 
 import httpx
+from cachetools import LRUCache
 
-from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.exceptions import (
+    MCPAtlassianAuthenticationError,
+    MCPAtlassianError,
+    MCPAtlassianNotFoundError,
+)
 from mcp_atlassian.models.zephyr import TestStep, TestStepRequest, ZephyrTestSteps
 from mcp_atlassian.utils.logging import get_masked_session_headers, log_config_param
+from mcp_atlassian.utils.serialization import dumps_bytes, loads
 
 from .auth import ZephyrAuth
 from .config import ZephyrConfig
+from .constants import (
+    KEEPALIVE_EXPIRY,
+    REQUEST_GZIP_LEVEL,
+    RETRY_JITTER,
+    RETRY_ON_SERVER_ERROR_METHODS,
+    RETRY_STATUS_CODES,
+    REVALIDATION_CACHE_SIZE,
+    SEARCH_PAGE_CONCURRENCY,
+    TEST_STEPS_CACHE_SIZE,
+)
 
 # Configure logging
 logger = logging.getLogger("mcp-atlassian.zephyr")
 
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 without it
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Constant envelope of the test script PUT body around the serialized steps
+_STEP_BY_STEP_PREFIX = b'{"testScript":{"type":"STEP_BY_STEP","steps":'
+_STEP_BY_STEP_SUFFIX = b"}}"
+
+# Value parsed from a revalidated GET response, or returned by an operation
+T = TypeVar("T")
+P = ParamSpec("P")
+
+
+def zephyr_call(
+    message: str,
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Translate unexpected errors of a Zephyr operation into MCPAtlassianError.
+    
+    MCPAtlassianError and its subclasses (such as MCPAtlassianNotFoundError)
+    pass through unchanged; any other exception is logged and re-raised as
+    MCPAtlassianError("<message>: <error>").
+    
+    Args:
+        message: Failure description, e.g. "Failed to get test case"
+        
+    Returns:
+        Decorator for async mixin methods
+    """
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            try:
+                return await func(*args, **kwargs)
+            except MCPAtlassianError:
+                raise
+            except Exception as e:
+                logger.error("%s: %s", message, e)
+                raise MCPAtlassianError(f"{message}: {e}") from e
+        
+        return wrapper
+    
+    return decorator
+
 
 class ZephyrClient:
     """Base client for Zephyr API interactions."""
@@ -35,7 +100,23 @@ class ZephyrClient:
 
         # Initialize authentication
         self.auth = ZephyrAuth(self.config)
-        self._http_client: httpx.Client | None = None
+        self._http_client: httpx.AsyncClient | None = None
+        # Bounds the requests in flight to Zephyr; each attempt, including
+        # retries, takes a slot only while it is on the wire
+        self._request_gate = asyncio.Semaphore(self.config.max_concurrent_requests)
+        # Last fetched test steps by issue ID, with the ETag they were served
+        # with; revalidated with If-None-Match instead of refetched. Entries
+        # written after a PUT also keep the script steps payload that was sent.
+        self._test_steps_cache: LRUCache[
+            str, tuple[str, ZephyrTestSteps, list[dict[str, Any]] | None]
+        ] = LRUCache(maxsize=TEST_STEPS_CACHE_SIZE)
+        # Parsed GET responses by URL and query parameters, with the ETag and
+        # Last-Modified validators they were served with and when they were
+        # last known to be current (time.monotonic)
+        self._revalidation_cache: LRUCache[
+            tuple[str, tuple[tuple[str, Any], ...]],
+            tuple[str | None, str | None, float, Any],
+        ] = LRUCache(maxsize=REVALIDATION_CACHE_SIZE)
 
         # Initialize HTTP client
         self._initialize_http_client()
@@ -46,12 +127,28 @@ class ZephyrClient:
 
     def _initialize_http_client(self) -> None:
         """Initialize the HTTP client."""
-        # Create HTTP client with SSL configuration
-        self._http_client = httpx.Client(
+        # Create HTTP client with SSL configuration. Requests are awaited so
+        # concurrent tool calls do not block the event loop. Tool calls arrive
+        # seconds apart, so idle connections are kept well past httpx's 5s
+        # default to avoid a new TCP/TLS handshake on every call. The pool is
+        # sized (ZEPHYR_MAX_CONNECTIONS) so bursts of parallel tool calls do
+        # not queue for a connection.
+        # The bearer token and custom headers are fixed for the process, so
+        # they are merged once and sent as client defaults.
+        headers = self.auth.get_default_headers()
+        if self.config.custom_headers:
+            headers.update(self.config.custom_headers)
+            logger.debug(
+                "Applying %s custom headers to Zephyr session: %s",
+                len(self.config.custom_headers),
+                ", ".join(self.config.custom_headers),
+            )
+        self._http_client = httpx.AsyncClient(
             base_url=self.config.base_url,
+            headers=headers,
             timeout=httpx.Timeout(self.config.timeout),
-            limits=httpx.Limits(max_connections=5, max_keepalive_connections=2),
-            verify=self.config.ssl_verify,
+            transport=self._build_transport(),
+            mounts=self._proxy_mounts(),
         )
 
         # Log SSL configuration
@@ -62,44 +159,77 @@ class ZephyrClient:
         else:
             logger.debug("Zephyr SSL verification enabled")
 
-        # Proxy configuration
-        proxies = {}
-        if self.config.http_proxy:
-            proxies["http://"] = self.config.http_proxy
-        if self.config.https_proxy:
-            proxies["https://"] = self.config.https_proxy
-        if self.config.socks_proxy:
-            proxies["socks://"] = self.config.socks_proxy
-        if proxies:
-            # Update the client with proxy configuration
-            self._http_client.proxies = proxies
-            for k, v in proxies.items():
-                log_config_param(
-                    logger, "Zephyr", f"{k.upper()}_PROXY", v, sensitive=True
-                )
-        if self.config.no_proxy and isinstance(self.config.no_proxy, str):
-            os.environ["NO_PROXY"] = self.config.no_proxy
-            log_config_param(logger, "Zephyr", "NO_PROXY", self.config.no_proxy)
-
-        # Apply custom headers if configured
-        if self.config.custom_headers:
-            self._apply_custom_headers()
+        logger.info("Zephyr client initialized with base URL: %s", self.config.base_url)
 
-        logger.info(f"Zephyr client initialized with base URL: {self.config.base_url}")
+    def _build_transport(self, proxy: str | None = None) -> httpx.AsyncHTTPTransport:
+        """Build a pooled transport, optionally routed through a proxy.
+        
+        Failed connection attempts are retried by the transport
+        (ZEPHYR_MAX_RETRIES) instead of failing the tool call; pool, TLS and
+        HTTP/2 settings belong to the transport once one is passed.
+        
+        Args:
+            proxy: Optional proxy URL
+            
+        Returns:
+            The transport
+        """
+        return httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            verify=self.config.ssl_verify,
+            retries=self.config.max_retries,
+            proxy=proxy,
+        )
 
-    def _apply_custom_headers(self) -> None:
-        """Apply custom headers to the Zephyr session."""
-        if not self.config.custom_headers or not self._http_client:
-            return
+    def _proxy_mounts(self) -> dict[str, httpx.AsyncHTTPTransport | None]:
+        """Build the per-scheme proxy transports of the client.
+        
+        httpx ignores HTTP(S)_PROXY / ALL_PROXY / NO_PROXY once a custom
+        transport is passed, so they are applied here. The ZEPHYR_*_PROXY
+        settings take precedence over the environment. Hosts matched by
+        NO_PROXY are mounted as None, which sends them through the default
+        transport.
+        
+        Returns:
+            Mounts for httpx.AsyncClient (empty when no proxy applies)
+        """
+        env_proxies = getproxies()
+        mounts: dict[str, httpx.AsyncHTTPTransport | None] = {}
+        for scheme, configured in (
+            ("http", self.config.http_proxy),
+            ("https", self.config.https_proxy),
+        ):
+            proxy = (
+                configured
+                or self.config.socks_proxy
+                or env_proxies.get(scheme)
+                or env_proxies.get("all")
+            )
+            if proxy:
+                mounts[f"{scheme}://"] = self._build_transport(proxy)
+                log_config_param(
+                    logger, "Zephyr", f"{scheme.upper()}_PROXY", proxy, sensitive=True
+                )
+        if not mounts:
+            return mounts
 
-        logger.debug(
-            f"Applying {len(self.config.custom_headers)} custom headers to Zephyr session"
-        )
-        for header_name, header_value in self.config.custom_headers.items():
-            self._http_client.headers[header_name] = header_value
-            logger.debug(f"Applied custom header: {header_name}")
+        no_proxy = self.config.no_proxy or env_proxies.get("no", "")
+        if no_proxy:
+            log_config_param(logger, "Zephyr", "NO_PROXY", no_proxy)
+        for host in no_proxy.split(","):
+            host = host.strip()
+            if host == "*":
+                return {}
+            if host:
+                mounts[host if "://" in host else f"all://*{host.lstrip('*')}"] = None
+        return mounts
 
-    def _validate_authentication(self) -> None:
+    async def _validate_authentication(self) -> None:
         """Validate Zephyr connection and authentication."""
         try:
             logger.debug("Testing Zephyr authentication...")
@@ -108,7 +238,7 @@ class ZephyrClient:
             url = "/rest/atm/1.0/environments"
             params = {"projectKey": "TEST"}  # Use a test project key
             
-            response = self.request("GET", url, params=params)
+            response = await self.request("GET", url, params=params)
             response.raise_for_status()
             
             logger.info("Zephyr authentication successful")
@@ -124,56 +254,119 @@ class ZephyrClient:
             logger.error(error_msg)
             raise MCPAtlassianAuthenticationError(error_msg)
 
-    def close(self) -> None:
+    async def close(self) -> None:
         """Close client connections."""
         if self._http_client:
-            self._http_client.close()
+            await self._http_client.aclose()
             self._http_client = None
         logger.info("Zephyr client connections closed")
 
-    def request(
+    async def request(
         self, 
         method: str, 
         url: str, 
+        not_found_message: str | None = None,
         **kwargs: Any
     ) -> httpx.Response:
         """Make HTTP request with authentication.
         
+        Authentication headers are client defaults set at initialization,
+        so httpx adds them to every request. At most max_concurrent_requests
+        requests are in flight at once; callers beyond that wait for a slot.
+        Throttled (429) responses, and 5xx responses to idempotent methods,
+        are retried up to max_retries times with jittered exponential
+        backoff, honouring Retry-After up to max_retry_after seconds; a
+        longer Retry-After returns the response without retrying.
+        
         Args:
             method: HTTP method
             url: Request URL (relative to base URL)
+            not_found_message: If set, a 404 response raises
+                MCPAtlassianNotFoundError with this message
             **kwargs: Additional request parameters
             
         Returns:
             HTTP response
             
         Raises:
+            MCPAtlassianNotFoundError: If the response is a 404 and
+                not_found_message is set
             MCPAtlassianAuthenticationError: If request fails
         """
         if not self._http_client:
             raise MCPAtlassianAuthenticationError("HTTP client not initialized")
         
-        # Add authentication headers
-        headers = self.auth.get_auth_headers(method, url)
-        if "headers" in kwargs:
-            kwargs["headers"].update(headers)
-        else:
-            kwargs["headers"] = headers
-        
         try:
-            response = self._http_client.request(method, url, **kwargs)
-            
-            # Log request details in debug mode
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Zephyr API {method} {url} -> {response.status_code}")
+            attempt = 0
+            while True:
+                async with self._request_gate:
+                    response = await self._http_client.request(method, url, **kwargs)
+                
+                # Log request details in debug mode
+                logger.debug("Zephyr API %s %s -> %s", method, url, response.status_code)
+                
+                if attempt >= self.config.max_retries or not self._should_retry(
+                    method, response.status_code
+                ):
+                    break
                 
-            return response
+                delay = self._retry_delay(response, attempt)
+                if delay is None:
+                    logger.warning(
+                        "Zephyr API %s %s returned %s with Retry-After %ss, "
+                        "above the %ss limit; not retrying",
+                        method, url, response.status_code,
+                        response.headers["Retry-After"], self.config.max_retry_after,
+                    )
+                    break
+                logger.warning(
+                    "Zephyr API %s %s returned %s, retrying in %.1fs",
+                    method, url, response.status_code, delay,
+                )
+                await response.aclose()
+                await asyncio.sleep(delay)
+                attempt += 1
             
         except Exception as e:
-            logger.error(f"Zephyr API request failed: {method} {url} - {e}")
+            logger.error("Zephyr API request failed: %s %s - %s", method, url, e)
             raise MCPAtlassianAuthenticationError(f"Request failed: {e}")
+        
+        if not_found_message is not None and response.status_code == 404:
+            raise MCPAtlassianNotFoundError(not_found_message)
+        return response
+
+    @staticmethod
+    def _should_retry(method: str, status_code: int) -> bool:
+        """Check whether a response status is worth retrying for a method."""
+        if status_code not in RETRY_STATUS_CODES:
+            return False
+        return status_code == 429 or method.upper() in RETRY_ON_SERVER_ERROR_METHODS
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float | None:
+        """Seconds to wait before retrying a response.
+        
+        A numeric Retry-After header wins, up to max_retry_after; a longer
+        one means the response is not retried, so the caller fails fast
+        instead of stalling. Otherwise retry_delay doubles with each
+        attempt, plus up to RETRY_JITTER of it at random so concurrent
+        callers do not retry in lockstep.
+        
+        Args:
+            response: The response being retried
+            attempt: Number of retries already made
+            
+        Returns:
+            The delay in seconds, or None if the response should not be
+            retried
+        """
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = float(retry_after)
+            return delay if delay <= self.config.max_retry_after else None
+        delay = self.config.retry_delay * 2**attempt
+        return delay + random.uniform(0, delay * RETRY_JITTER)  # noqa: S311
 
-    def get_test_steps(self, issue_id: str, project_id: str) -> ZephyrTestSteps:
+    async def get_test_steps(self, issue_id: str, project_id: str) -> ZephyrTestSteps:
         """Get test steps for a test case using Zephyr Scale (Server) API.
         
         Note: This method attempts to retrieve test steps from a test case.
@@ -190,26 +383,38 @@ class ZephyrClient:
         Raises:
             MCPAtlassianAuthenticationError: If API request fails
         """
-        logger.info(f"Getting test steps for test case {issue_id}")
+        logger.info("Getting test steps for test case %s", issue_id)
         
         try:
             # Use the test case endpoint to get test case details including test script
             url = f"/rest/atm/1.0/testcase/{issue_id}"
             params = {"fields": "key,name,testScript"}
+            headers = {}
+            cached = self._test_steps_cache.get(issue_id)
+            if cached is not None:
+                headers["If-None-Match"] = cached[0]
             
-            response = self.request("GET", url, params=params)
+            response = await self.request("GET", url, params=params, headers=headers)
+            
+            if response.status_code == 304 and cached is not None:
+                logger.debug("Test steps for test case %s not modified", issue_id)
+                test_steps = cached[1]
+                if test_steps.project_id != project_id:
+                    test_steps = test_steps.model_copy(update={"project_id": project_id})
+                return test_steps
             
             if response.status_code == 404:
-                logger.warning(f"Test case {issue_id} not found")
+                self._test_steps_cache.pop(issue_id, None)
+                logger.warning("Test case %s not found", issue_id)
                 # Return empty test steps
-                return ZephyrTestSteps(
+                return ZephyrTestSteps.from_api_values(
                     issue_id=issue_id,
                     project_id=project_id,
                     steps=[]
                 )
                 
             response.raise_for_status()
-            data = response.json()
+            data = self._get_json(response)
             
             # Extract steps from test script
             steps = []
@@ -218,11 +423,11 @@ class ZephyrClient:
             if test_script and test_script.get("type") == "STEP_BY_STEP":
                 script_steps = test_script.get("steps", [])
                 for i, step_data in enumerate(script_steps):
-                    step = TestStep(
+                    step = TestStep.from_api_values(
                         order_id=i + 1,
                         step=step_data.get("description", ""),
-                        data=step_data.get("testData", ""),
-                        result=step_data.get("expectedResult", ""),
+                        data=step_data.get("testData") or "",
+                        result=step_data.get("expectedResult") or "",
                         step_id=step_data.get("id")
                     )
                     steps.append(step)
@@ -230,7 +435,7 @@ class ZephyrClient:
                 # For plain text scripts, create a single step
                 text_content = test_script.get("text", "")
                 if text_content:
-                    step = TestStep(
+                    step = TestStep.from_api_values(
                         order_id=1,
                         step=text_content,
                         data="",
@@ -239,22 +444,23 @@ class ZephyrClient:
                     )
                     steps.append(step)
             
-            test_steps = ZephyrTestSteps(
+            test_steps = ZephyrTestSteps.from_api_values(
                 issue_id=issue_id,
                 project_id=project_id,
                 steps=steps
             )
+            self._cache_test_steps(response, test_steps)
             
-            logger.info(f"Retrieved {len(test_steps.steps)} test steps for test case {issue_id}")
+            logger.info("Retrieved %s test steps for test case %s", len(test_steps.steps), issue_id)
             return test_steps
             
         except Exception as e:
-            logger.error(f"Failed to get test steps for test case {issue_id}: {e}")
+            logger.error("Failed to get test steps for test case %s: %s", issue_id, e)
             if "authentication" in str(e).lower() or "401" in str(e):
                 raise MCPAtlassianAuthenticationError(f"Authentication failed: {e}")
             raise MCPAtlassianAuthenticationError(f"Failed to get test steps: {e}")
 
-    def add_test_step(
+    async def add_test_step(
         self, 
         issue_id: str, 
         project_id: str, 
@@ -262,8 +468,8 @@ class ZephyrClient:
     ) -> TestStep:
         """Add a test step to a test case by updating its test script.
         
-        Note: This method updates the test case's test script to add a new step.
-        For Zephyr Scale Server, we need to update the entire test script.
+        Note: Zephyr Scale Server has no per-step endpoint, so this goes
+        through add_multiple_test_steps, which rewrites the entire test script.
         
         Args:
             issue_id: JIRA issue ID (test case key like 'JQA-T123') 
@@ -276,63 +482,10 @@ class ZephyrClient:
         Raises:
             MCPAtlassianAuthenticationError: If API request fails
         """
-        logger.info(f"Adding test step to test case {issue_id}: {step_request.step}")
-        
-        try:
-            # First, get the current test case to retrieve existing test script
-            current_case = self.get_test_steps(issue_id, project_id)
-            
-            # Determine the next order ID
-            next_order = len(current_case.steps) + 1
-            
-            # Create the new test step
-            new_step = TestStep(
-                order_id=next_order,
-                step=step_request.step,
-                data=step_request.data or "",
-                result=step_request.result or "",
-                step_id=None  # Will be assigned by Zephyr
-            )
-            
-            # Prepare the updated test script
-            all_steps = current_case.steps + [new_step]
-            
-            # Build the test script steps data
-            script_steps = []
-            for step in all_steps:
-                script_steps.append({
-                    "description": step.step,
-                    "testData": step.data,
-                    "expectedResult": step.result
-                })
-            
-            # Prepare the update payload
-            payload = {
-                "testScript": {
-                    "type": "STEP_BY_STEP",
-                    "steps": script_steps
-                }
-            }
-            
-            # Update the test case
-            url = f"/rest/atm/1.0/testcase/{issue_id}"
-            response = self.request("PUT", url, json=payload)
-            
-            if response.status_code == 404:
-                raise MCPAtlassianAuthenticationError(f"Test case {issue_id} not found")
-                
-            response.raise_for_status()
-            
-            logger.info(f"Successfully added test step to test case {issue_id}")
-            return new_step
-            
-        except Exception as e:
-            logger.error(f"Failed to add test step to test case {issue_id}: {e}")
-            if "authentication" in str(e).lower() or "401" in str(e):
-                raise MCPAtlassianAuthenticationError(f"Authentication failed: {e}")
-            raise MCPAtlassianAuthenticationError(f"Failed to add test step: {e}")
+        logger.info("Adding test step to test case %s: %s", issue_id, step_request.step)
+        return (await self.add_multiple_test_steps(issue_id, project_id, [step_request]))[0]
 
-    def add_multiple_test_steps(
+    async def add_multiple_test_steps(
         self,
         issue_id: str,
         project_id: str,
@@ -340,6 +493,14 @@ class ZephyrClient:
     ) -> list[TestStep]:
         """Add multiple test steps to a test case by updating its test script.
         
+        All steps are appended in one read-modify-write of the test script
+        (one GET, one PUT). The GET is a conditional request when the steps
+        are cached, and the cache is updated from the PUT, so repeated
+        appends to one test case do not re-download its existing steps.
+        Do not fan this out into concurrent add_test_step
+        calls: each of those rewrites the whole script, so parallel calls
+        would overwrite each other's steps.
+        
         Args:
             issue_id: JIRA issue ID (test case key)
             project_id: JIRA project ID (not used in this implementation)
@@ -348,64 +509,367 @@ class ZephyrClient:
         Returns:
             List of created TestStep objects
         """
-        logger.info(f"Adding {len(step_requests)} test steps to test case {issue_id}")
+        return await self.add_test_step_entries(
+            issue_id,
+            project_id,
+            [
+                {
+                    "description": step_request.step,
+                    "testData": step_request.data or "",
+                    "expectedResult": step_request.result or "",
+                }
+                for step_request in step_requests
+            ],
+        )
+
+    async def add_test_step_entries(
+        self,
+        issue_id: str,
+        project_id: str,
+        new_entries: list[dict[str, Any]],
+    ) -> list[TestStep]:
+        """Append test script step entries to a test case.
+        
+        Entries are sent as-is, so callers that already hold steps in the
+        API's shape skip building TestStepRequest objects. TestStep objects
+        are only built for the return value, once the PUT succeeds.
+        
+        Args:
+            issue_id: JIRA issue ID (test case key)
+            project_id: JIRA project ID (not used in this implementation)
+            new_entries: Test script steps with description, testData and
+                expectedResult keys
+            
+        Returns:
+            List of created TestStep objects
+        """
+        if not new_entries:
+            return []
+        
+        logger.info("Adding %s test steps to test case %s", len(new_entries), issue_id)
         
         try:
             # Get current test case
-            current_case = self.get_test_steps(issue_id, project_id)
-            
-            # Create new test steps
-            new_steps = []
-            next_order = len(current_case.steps) + 1
-            
-            for i, step_request in enumerate(step_requests):
-                step = TestStep(
-                    order_id=next_order + i,
-                    step=step_request.step,
-                    data=step_request.data or "",
-                    result=step_request.result or "",
-                    step_id=None
-                )
-                new_steps.append(step)
-            
-            # Combine all steps
-            all_steps = current_case.steps + new_steps
-            
-            # Build the test script steps data
-            script_steps = []
-            for step in all_steps:
-                script_steps.append({
-                    "description": step.step,
-                    "testData": step.data,
-                    "expectedResult": step.result
-                })
-            
-            # Prepare the update payload
-            payload = {
-                "testScript": {
-                    "type": "STEP_BY_STEP",
-                    "steps": script_steps
-                }
-            }
-            
-            # Update the test case
+            current_case = await self.get_test_steps(issue_id, project_id)
+            
+            # Reuse the payload of the previous PUT when the existing steps
+            # came from the cache
+            cached = self._test_steps_cache.get(issue_id)
+            if (
+                cached is not None
+                and cached[2] is not None
+                and cached[1].steps is current_case.steps
+            ):
+                existing_script_steps = cached[2]
+            else:
+                existing_script_steps = [self._script_step(step) for step in current_case.steps]
+            script_steps = existing_script_steps + new_entries
+            
+            # Prepare the update payload; only the steps need encoding
+            body = _STEP_BY_STEP_PREFIX + dumps_bytes(script_steps) + _STEP_BY_STEP_SUFFIX
+            
+            # Update the test case (Content-Type is a client default header)
             url = f"/rest/atm/1.0/testcase/{issue_id}"
-            response = self.request("PUT", url, json=payload)
+            response = await self.request("PUT", url, content=body)
             
             if response.status_code == 404:
                 raise MCPAtlassianAuthenticationError(f"Test case {issue_id} not found")
                 
             response.raise_for_status()
+            # The steps are part of the test case, so drop its cached GET
+            self._forget_revalidated(f"/testcase/{issue_id}")
+            
+            next_order = len(current_case.steps) + 1
+            new_steps = [
+                TestStep.from_api_values(
+                    order_id=next_order + i,
+                    step=entry["description"],
+                    data=entry["testData"],
+                    result=entry["expectedResult"],
+                    step_id=None,
+                )
+                for i, entry in enumerate(new_entries)
+            ]
+            self._cache_test_steps(
+                response,
+                ZephyrTestSteps.from_api_values(
+                    issue_id=issue_id,
+                    project_id=project_id,
+                    steps=current_case.steps + new_steps,
+                ),
+                script_steps,
+            )
             
-            logger.info(f"Successfully added {len(new_steps)} test steps to test case {issue_id}")
+            logger.info(
+                "Successfully added %s test steps to test case %s",
+                len(new_steps), issue_id,
+            )
             return new_steps
             
         except Exception as e:
-            logger.error(f"Failed to add multiple test steps to test case {issue_id}: {e}")
+            logger.error("Failed to add multiple test steps to test case %s: %s", issue_id, e)
             if "authentication" in str(e).lower() or "401" in str(e):
                 raise MCPAtlassianAuthenticationError(f"Authentication failed: {e}")
             raise MCPAtlassianAuthenticationError(f"Failed to add test steps: {e}")
 
+    @staticmethod
+    def _script_step(step: TestStep) -> dict[str, Any]:
+        """Build the test script entry sent to the API for a test step."""
+        return {
+            "description": step.step,
+            "testData": step.data,
+            "expectedResult": step.result,
+        }
+
+    async def _get_revalidated(
+        self,
+        url: str,
+        parse: Callable[[bytes], T],
+        params: dict[str, Any] | None = None,
+        max_age: float = 0.0,
+    ) -> T | None:
+        """GET a resource, reusing the last parsed result while it is unchanged.
+        
+        A cached result younger than max_age seconds is returned without a
+        request. Older results are revalidated with If-None-Match /
+        If-Modified-Since; on 304 the result is returned without reading or
+        parsing a body. Responses that carry neither an ETag nor a
+        Last-Modified header are only cached when max_age is set.
+        
+        Args:
+            url: Request URL (relative to base URL)
+            parse: Builds the result from the raw response body
+            params: Optional query parameters
+            max_age: Seconds a cached result is used without revalidation
+            
+        Returns:
+            The parsed result, or None if the resource was not found (404)
+            
+        Raises:
+            httpx.HTTPStatusError: If the response has any other error status
+        """
+        cache_key = (url, tuple(params.items()) if params else ())
+        cached = self._revalidation_cache.get(cache_key)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, fetched_at, value = cached
+            if time.monotonic() - fetched_at < max_age:
+                return value
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        response = await self.request("GET", url, params=params, headers=headers)
+        
+        if response.status_code == 304 and cached is not None:
+            logger.debug("Zephyr API GET %s not modified", url)
+            self._revalidation_cache[cache_key] = (
+                cached[0], cached[1], time.monotonic(), cached[3]
+            )
+            return cached[3]
+        
+        if response.status_code == 404:
+            self._revalidation_cache.pop(cache_key, None)
+            return None
+        
+        response.raise_for_status()
+        value = parse(response.content)
+        
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified or max_age:
+            self._revalidation_cache[cache_key] = (
+                etag, last_modified, time.monotonic(), value
+            )
+        else:
+            self._revalidation_cache.pop(cache_key, None)
+        return value
+
+    def _forget_revalidated(self, url: str) -> None:
+        """Drop every cached GET result for a URL, whatever its query parameters.
+        
+        Args:
+            url: Request URL (relative to base URL) of a changed resource
+        """
+        for cache_key in [k for k in self._revalidation_cache if k[0] == url]:
+            self._revalidation_cache.pop(cache_key, None)
+
+    def _cache_test_steps(
+        self,
+        response: httpx.Response,
+        test_steps: ZephyrTestSteps,
+        script_steps: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """Cache test steps under the ETag of the response that produced them.
+        
+        Without an ETag the steps cannot be revalidated, so any cached entry
+        for the test case is dropped instead.
+        
+        Args:
+            response: Response to the GET or PUT of the test case
+            test_steps: Test steps matching the response
+            script_steps: Test script entries sent for the steps, if known
+        """
+        etag = response.headers.get("ETag")
+        if etag:
+            self._test_steps_cache[test_steps.issue_id] = (etag, test_steps, script_steps)
+        else:
+            self._test_steps_cache.pop(test_steps.issue_id, None)
+
+    @staticmethod
+    async def _search_all(
+        search_page: Callable[[int], Awaitable[list[T]]],
+        page_size: int,
+        concurrency: int = SEARCH_PAGE_CONCURRENCY,
+    ) -> list[T]:
+        """Fetch every page of a search, requesting pages concurrently.
+        
+        Search responses carry no total count, so after a full first page the
+        following pages are requested in groups of `concurrency` until a page
+        comes back short. Results are returned in page order.
+        
+        Args:
+            search_page: Fetches the page starting at the given offset
+            page_size: Number of results requested per page
+            concurrency: Number of pages requested at once
+            
+        Returns:
+            All search results
+        """
+        results = await search_page(0)
+        start_at = page_size
+        while len(results) == start_at:
+            pages = await asyncio.gather(
+                *(search_page(start_at + i * page_size) for i in range(concurrency))
+            )
+            for page in pages:
+                results.extend(page)
+                if len(page) < page_size:
+                    return results
+            start_at += concurrency * page_size
+        return results
+
+    @staticmethod
+    async def _iter_search(
+        search_page: Callable[[int], Awaitable[list[T]]],
+        page_size: int,
+    ) -> AsyncIterator[T]:
+        """Iterate over every result of a search, prefetching the next page.
+        
+        While the caller consumes one page, the following page is already
+        being requested. Iteration stops after the first short page.
+        
+        Args:
+            search_page: Fetches the page starting at the given offset
+            page_size: Number of results requested per page
+            
+        Yields:
+            Search results in order
+        """
+        start_at = 0
+        next_page = asyncio.ensure_future(search_page(start_at))
+        try:
+            while True:
+                page = await next_page
+                full = len(page) == page_size
+                if full:
+                    start_at += page_size
+                    next_page = asyncio.ensure_future(search_page(start_at))
+                for item in page:
+                    yield item
+                if not full:
+                    return
+        finally:
+            # The caller stopped early; drop the prefetched page
+            next_page.cancel()
+
+    @staticmethod
+    def _json_body(payload: Any, compress: bool = False) -> dict[str, Any]:
+        """Build the request arguments that send a payload as a JSON body.
+        
+        The body is serialized once, so retries resend the same bytes. The
+        client already sends Content-Type: application/json by default.
+        
+        Args:
+            payload: JSON-serializable request payload
+            compress: Gzip the body and mark it with Content-Encoding
+            
+        Returns:
+            content (and headers, when compressed) for request()
+        """
+        body = dumps_bytes(payload)
+        if not compress:
+            return {"content": body}
+        return {
+            "content": gzip.compress(body, compresslevel=REQUEST_GZIP_LEVEL),
+            "headers": {"Content-Encoding": "gzip"},
+        }
+
+    @staticmethod
+    def _search_params(
+        query: str | None, fields: str | None, start_at: int, max_results: int
+    ) -> list[tuple[str, str | int]]:
+        """Build the query parameters of a search request.
+        
+        maxResults is always sent, so the page size never depends on the
+        server default. The other parameters are only sent when set.
+        
+        Args:
+            query: TQL query string
+            fields: Comma-separated list of fields to include
+            start_at: Offset for pagination
+            max_results: Maximum number of results to return
+            
+        Returns:
+            Query parameters as (name, value) pairs
+        """
+        params: list[tuple[str, str | int]] = [("maxResults", max_results)]
+        if query:
+            params.append(("query", query))
+        if fields:
+            params.append(("fields", fields))
+        if start_at > 0:
+            params.append(("startAt", start_at))
+        return params
+
+    @staticmethod
+    def _result_params(
+        environment: str | None, user_key: str | None
+    ) -> dict[str, str] | None:
+        """Build the optional environment / userKey filters of a result request.
+        
+        Args:
+            environment: Optional environment filter
+            user_key: Optional user key filter
+            
+        Returns:
+            Query parameters, or None when neither filter is set
+        """
+        if not (environment or user_key):
+            return None
+        params = {}
+        if environment:
+            params["environment"] = environment
+        if user_key:
+            params["userKey"] = user_key
+        return params
+
+    @staticmethod
+    def _get_json(response: httpx.Response) -> Any:
+        """Decode the JSON body of a response that passed its status checks.
+        
+        The raw body bytes are parsed directly (with orjson when available),
+        skipping the text decode that httpx's Response.json() does first.
+        
+        Args:
+            response: HTTP response
+            
+        Returns:
+            Decoded JSON data
+        """
+        return loads(response.content)
+
     def _safe_get_json(self, response: httpx.Response) -> dict[str, Any]:
         """Safely extract JSON from response.
         
@@ -416,7 +880,7 @@ class ZephyrClient:
             JSON data or empty dict if parsing fails
         """
         try:
-            return response.json()
+            return self._get_json(response)
         except Exception as e:
-            logger.warning(f"Failed to parse JSON response: {e}")
+            logger.warning("Failed to parse JSON response: %s", e)
             return {} 
\ No newline at end of file
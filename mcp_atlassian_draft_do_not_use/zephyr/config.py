@@ -3,9 +3,11 @@
 import logging
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from mcp_atlassian.utils.logging import log_config_param
+from mcp_atlassian.utils.serialization import loads
 
 logger = logging.getLogger("mcp-atlassian.zephyr.config")
 
@@ -22,6 +24,13 @@ class ZephyrConfig:
     timeout: int = 30
     max_retries: int = 3
     retry_delay: float = 1.0
+    # Longest Retry-After honoured; a longer one is not retried
+    max_retry_after: float = 60.0
+    
+    # Connection pool settings
+    max_connections: int = 50
+    max_keepalive: int = 25
+    max_concurrent_requests: int = 32
     
     # Proxy settings
     http_proxy: Optional[str] = None
@@ -32,12 +41,21 @@ class ZephyrConfig:
     # SSL verification
     ssl_verify: bool = True
     
+    # Gzip large request bodies (the server must accept Content-Encoding: gzip)
+    compress_requests: bool = False
+    
     # Custom headers
     custom_headers: Optional[dict[str, str]] = None
 
     @classmethod
+    @lru_cache(maxsize=1)
     def from_env(cls) -> "ZephyrConfig":
-        """Create ZephyrConfig from environment variables."""
+        """Create ZephyrConfig from environment variables.
+        
+        The environment is read, and the configuration logged, once per
+        process; later calls return the same frozen instance. A missing
+        setting raises every time, since exceptions are not cached.
+        """
         
         # Required settings
         api_token = os.getenv("ZEPHYR_API_TOKEN")
@@ -57,6 +75,10 @@ class ZephyrConfig:
         timeout = int(os.getenv("ZEPHYR_TIMEOUT", "30"))
         max_retries = int(os.getenv("ZEPHYR_MAX_RETRIES", "3"))
         retry_delay = float(os.getenv("ZEPHYR_RETRY_DELAY", "1.0"))
+        max_retry_after = float(os.getenv("ZEPHYR_MAX_RETRY_AFTER", "60"))
+        max_connections = int(os.getenv("ZEPHYR_MAX_CONNECTIONS", "50"))
+        max_keepalive = int(os.getenv("ZEPHYR_MAX_KEEPALIVE", "25"))
+        max_concurrent_requests = int(os.getenv("ZEPHYR_MAX_CONCURRENT_REQUESTS", "32"))
         
         # Proxy settings
         http_proxy = os.getenv("ZEPHYR_HTTP_PROXY")
@@ -67,13 +89,17 @@ class ZephyrConfig:
         # SSL verification
         ssl_verify = os.getenv("ZEPHYR_SSL_VERIFY", "true").lower() not in ("false", "0", "no", "off")
         
+        # Request compression
+        compress_requests = os.getenv("ZEPHYR_COMPRESS_REQUESTS", "false").lower() in (
+            "true", "1", "yes", "on"
+        )
+        
         # Custom headers
         custom_headers = None
         if os.getenv("ZEPHYR_CUSTOM_HEADERS"):
             try:
-                import json
-                custom_headers = json.loads(os.getenv("ZEPHYR_CUSTOM_HEADERS", "{}"))
-            except (json.JSONDecodeError, TypeError):
+                custom_headers = loads(os.getenv("ZEPHYR_CUSTOM_HEADERS", "{}"))
+            except (ValueError, TypeError):
                 logger.warning("Invalid ZEPHYR_CUSTOM_HEADERS format, ignoring")
         
         config = cls(
@@ -82,22 +108,32 @@ class ZephyrConfig:
             timeout=timeout,
             max_retries=max_retries,
             retry_delay=retry_delay,
+            max_retry_after=max_retry_after,
+            max_connections=max_connections,
+            max_keepalive=max_keepalive,
+            max_concurrent_requests=max_concurrent_requests,
             http_proxy=http_proxy,
             https_proxy=https_proxy,
             socks_proxy=socks_proxy,
             no_proxy=no_proxy,
             ssl_verify=ssl_verify,
+            compress_requests=compress_requests,
             custom_headers=custom_headers,
         )
         
-        # Log configuration (mask sensitive data)
-        log_config_param(logger, "Zephyr", "BASE_URL", config.base_url)
-        log_config_param(logger, "Zephyr", "API_TOKEN", config.api_token[:8] + "...", sensitive=True)
-        log_config_param(logger, "Zephyr", "TIMEOUT", str(config.timeout))
-        log_config_param(logger, "Zephyr", "SSL_VERIFY", str(config.ssl_verify))
-        
+        config._log_config()
         return config
 
+    def _log_config(self) -> None:
+        """Log the loaded configuration, masking sensitive values.
+        
+        Called by from_env, which is memoized, so this runs once per process.
+        """
+        log_config_param(logger, "Zephyr", "BASE_URL", self.base_url)
+        log_config_param(logger, "Zephyr", "API_TOKEN", self.api_token[:8] + "...", sensitive=True)
+        log_config_param(logger, "Zephyr", "TIMEOUT", str(self.timeout))
+        log_config_param(logger, "Zephyr", "SSL_VERIFY", str(self.ssl_verify))
+
     def is_auth_configured(self) -> bool:
         """Check if authentication is properly configured."""
         return bool(self.api_token and self.base_url)
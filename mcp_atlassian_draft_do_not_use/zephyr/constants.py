@@ -16,6 +16,26 @@ DEFAULT_ZEPHYR_TIMEOUT = 30
 # JWT constants removed - now using Bearer token authentication
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0
+# Seconds an idle pooled connection is kept open for reuse
+KEEPALIVE_EXPIRY = 60.0
+# Responses retried with backoff: throttling for any method, server errors
+# only for methods that are safe to repeat
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_ON_SERVER_ERROR_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+# Fraction of each backoff delay added as random jitter
+RETRY_JITTER = 0.5
+# Test cases whose steps are kept for ETag revalidation
+TEST_STEPS_CACHE_SIZE = 256
+# Parsed GET responses kept for ETag / Last-Modified revalidation
+REVALIDATION_CACHE_SIZE = 1024
+# Bulk test results above which the request body is gzipped (when enabled)
+BULK_GZIP_THRESHOLD = 50
+REQUEST_GZIP_LEVEL = 3
+# Search pages requested at once when fetching every page of a search
+SEARCH_PAGE_CONCURRENCY = 4
+# Seconds a fetched test case, plan or run is reused without revalidation;
+# the get tools for these entities are not cached again in the server
+ENTITY_CACHE_TTL = 60.0
 
 # Zephyr test step field names
 FIELD_ORDER_ID = "orderId"
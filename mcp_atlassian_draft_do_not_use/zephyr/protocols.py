@@ -1,5 +1,6 @@
 """Protocol interfaces for Zephyr operations."""
 
+from collections.abc import AsyncIterator, Sequence
 from typing import Any, Protocol
 
 from mcp_atlassian.models.zephyr import (
@@ -13,23 +14,23 @@ from mcp_atlassian.models.zephyr import (
 class ZephyrTestCaseOperationsProto(Protocol):
     """Protocol for Zephyr test case operations."""
 
-    def get_testcase(self, test_case_key: str, fields: str | None = None) -> ZephyrTestCase:
+    async def get_testcase(self, test_case_key: str, fields: str | None = None) -> ZephyrTestCase:
         """Get a test case by key."""
         ...
 
-    def create_testcase(self, testcase_data: dict[str, Any]) -> str:
+    async def create_testcase(self, testcase_data: dict[str, Any]) -> str:
         """Create a new test case."""
         ...
 
-    def update_testcase(self, test_case_key: str, testcase_data: dict[str, Any]) -> None:
+    async def update_testcase(self, test_case_key: str, testcase_data: dict[str, Any]) -> None:
         """Update a test case."""
         ...
 
-    def delete_testcase(self, test_case_key: str) -> None:
+    async def delete_testcase(self, test_case_key: str) -> None:
         """Delete a test case."""
         ...
 
-    def search_testcases(
+    async def search_testcases(
         self,
         query: str | None = None,
         fields: str | None = None,
@@ -39,27 +40,36 @@ class ZephyrTestCaseOperationsProto(Protocol):
         """Search for test cases."""
         ...
 
+    async def search_testcases_all(
+        self,
+        query: str | None = None,
+        fields: str | None = None,
+        page_size: int = 200,
+    ) -> list[ZephyrTestCase]:
+        """Search for test cases, returning every page of results."""
+        ...
+
 
 class ZephyrTestPlanOperationsProto(Protocol):
     """Protocol for Zephyr test plan operations."""
 
-    def get_testplan(self, test_plan_key: str, fields: str | None = None) -> ZephyrTestPlan:
+    async def get_testplan(self, test_plan_key: str, fields: str | None = None) -> ZephyrTestPlan:
         """Get a test plan by key."""
         ...
 
-    def create_testplan(self, testplan_data: dict[str, Any]) -> str:
+    async def create_testplan(self, testplan_data: dict[str, Any]) -> str:
         """Create a new test plan."""
         ...
 
-    def update_testplan(self, test_plan_key: str, testplan_data: dict[str, Any]) -> None:
+    async def update_testplan(self, test_plan_key: str, testplan_data: dict[str, Any]) -> None:
         """Update a test plan."""
         ...
 
-    def delete_testplan(self, test_plan_key: str) -> None:
+    async def delete_testplan(self, test_plan_key: str) -> None:
         """Delete a test plan."""
         ...
 
-    def search_testplans(
+    async def search_testplans(
         self,
         query: str | None = None,
         fields: str | None = None,
@@ -69,23 +79,32 @@ class ZephyrTestPlanOperationsProto(Protocol):
         """Search for test plans."""
         ...
 
+    async def search_testplans_all(
+        self,
+        query: str | None = None,
+        fields: str | None = None,
+        page_size: int = 200,
+    ) -> list[ZephyrTestPlan]:
+        """Search for test plans, returning every page of results."""
+        ...
+
 
 class ZephyrTestRunOperationsProto(Protocol):
     """Protocol for Zephyr test run operations."""
 
-    def get_testrun(self, test_run_key: str, fields: str | None = None) -> ZephyrTestRun:
+    async def get_testrun(self, test_run_key: str, fields: str | None = None) -> ZephyrTestRun:
         """Get a test run by key."""
         ...
 
-    def create_testrun(self, testrun_data: dict[str, Any]) -> str:
+    async def create_testrun(self, testrun_data: dict[str, Any]) -> str:
         """Create a new test run."""
         ...
 
-    def delete_testrun(self, test_run_key: str) -> None:
+    async def delete_testrun(self, test_run_key: str) -> None:
         """Delete a test run."""
         ...
 
-    def search_testruns(
+    async def search_testruns(
         self,
         query: str | None = None,
         fields: str | None = None,
@@ -95,23 +114,38 @@ class ZephyrTestRunOperationsProto(Protocol):
         """Search for test runs."""
         ...
 
+    def iter_all_testruns(
+        self,
+        query: str | None = None,
+        fields: str | None = None,
+        page_size: int = 200,
+    ) -> AsyncIterator[ZephyrTestRun]:
+        """Iterate over every test run matching a search."""
+        ...
+
 
 class ZephyrTestResultOperationsProto(Protocol):
     """Protocol for Zephyr test result operations."""
 
-    def create_testresult(self, testresult_data: dict[str, Any]) -> int:
+    async def create_testresult(self, testresult_data: dict[str, Any]) -> int:
         """Create a new test result."""
         ...
 
-    def get_testcase_latest_result(self, test_case_key: str) -> ZephyrTestResult | None:
+    async def get_testcase_latest_result(self, test_case_key: str) -> ZephyrTestResult | None:
         """Get the latest test result for a test case."""
         ...
 
-    def get_testrun_results(self, test_run_key: str) -> list[ZephyrTestResult]:
+    async def get_testcase_latest_results(
+        self, test_case_keys: Sequence[str]
+    ) -> list[ZephyrTestResult | None]:
+        """Get the latest test results for several test cases concurrently."""
+        ...
+
+    async def get_testrun_results(self, test_run_key: str) -> list[ZephyrTestResult]:
         """Get all test results for a test run."""
         ...
 
-    def create_testrun_result(
+    async def create_testrun_result(
         self,
         test_run_key: str,
         test_case_key: str,
@@ -122,7 +156,7 @@ class ZephyrTestResultOperationsProto(Protocol):
         """Create a test result within a test run."""
         ...
 
-    def update_testrun_result(
+    async def update_testrun_result(
         self,
         test_run_key: str,
         test_case_key: str,
@@ -133,7 +167,31 @@ class ZephyrTestResultOperationsProto(Protocol):
         """Update the latest test result within a test run."""
         ...
 
-    def create_bulk_testrun_results(
+    async def create_testrun_results(
+        self,
+        test_run_key: str,
+        results: Sequence[tuple[str, dict[str, Any]]],
+        environment: str | None = None,
+        user_key: str | None = None,
+    ) -> list[int]:
+        """Create test results for several test cases of a test run in bulk requests.
+
+        Each bulk request is all-or-nothing; on failure the raised
+        MCPAtlassianBulkCreateError lists the IDs the server did create.
+        """
+        ...
+
+    async def update_testrun_results(
+        self,
+        test_run_key: str,
+        results: Sequence[tuple[str, dict[str, Any]]],
+        environment: str | None = None,
+        user_key: str | None = None,
+    ) -> list[int]:
+        """Update the latest test results of several test cases concurrently."""
+        ...
+
+    async def create_bulk_testrun_results(
         self,
         test_run_key: str,
         testresults_data: list[dict[str, Any]],
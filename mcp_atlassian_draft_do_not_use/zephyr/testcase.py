@@ -1,15 +1,13 @@
 """Zephyr Test Case operations mixin."""
 
-import logging
 from typing import Any
 
-from mcp_atlassian.exceptions import MCPAtlassianError, MCPAtlassianNotFoundError
+from mcp_atlassian.exceptions import MCPAtlassianNotFoundError
 from mcp_atlassian.models.zephyr import ZephyrTestCase
-from mcp_atlassian.zephyr.client import ZephyrClient
+from mcp_atlassian.zephyr.client import ZephyrClient, zephyr_call
+from mcp_atlassian.zephyr.constants import ENTITY_CACHE_TTL
 from mcp_atlassian.zephyr.protocols import ZephyrTestCaseOperationsProto
 
-logger = logging.getLogger("mcp-atlassian.zephyr.testcase")
-
 
 class ZephyrTestCaseMixin(
     ZephyrClient,
@@ -17,7 +15,8 @@ class ZephyrTestCaseMixin(
 ):
     """Mixin providing Zephyr test case operations."""
 
-    def get_testcase(self, test_case_key: str, fields: str | None = None) -> ZephyrTestCase:
+    @zephyr_call("Failed to get test case")
+    async def get_testcase(self, test_case_key: str, fields: str | None = None) -> ZephyrTestCase:
         """Get a test case by key.
         
         Args:
@@ -31,30 +30,19 @@ class ZephyrTestCaseMixin(
             MCPAtlassianNotFoundError: If test case is not found
             MCPAtlassianError: If API request fails
         """
-        try:
-            params = {}
-            if fields:
-                params["fields"] = fields
-                
-            response = self.request(
-                method="GET",
-                url=f"/testcase/{test_case_key}",
-                params=params
-            )
-            
-            if response.status_code == 404:
-                raise MCPAtlassianNotFoundError(f"Test case {test_case_key} not found")
-                
-            response.raise_for_status()
-            return ZephyrTestCase.from_api_response(response.json())
-            
-        except Exception as e:
-            if isinstance(e, (MCPAtlassianNotFoundError, MCPAtlassianError)):
-                raise
-            logger.error(f"Failed to get test case {test_case_key}: {e}")
-            raise MCPAtlassianError(f"Failed to get test case: {e}") from e
+        test_case = await self._get_revalidated(
+            f"/testcase/{test_case_key}",
+            ZephyrTestCase.from_api_bytes,
+            {"fields": fields} if fields else None,
+            max_age=ENTITY_CACHE_TTL,
+        )
+        
+        if test_case is None:
+            raise MCPAtlassianNotFoundError(f"Test case {test_case_key} not found")
+        return test_case
 
-    def create_testcase(self, testcase_data: dict[str, Any]) -> str:
+    @zephyr_call("Failed to create test case")
+    async def create_testcase(self, testcase_data: dict[str, Any]) -> str:
         """Create a new test case.
         
         Args:
@@ -66,22 +54,18 @@ class ZephyrTestCaseMixin(
         Raises:
             MCPAtlassianError: If creation fails
         """
-        try:
-            response = self.request(
-                method="POST",
-                url="/testcase",
-                json=testcase_data
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            return result.get("key", "")
-            
-        except Exception as e:
-            logger.error(f"Failed to create test case: {e}")
-            raise MCPAtlassianError(f"Failed to create test case: {e}") from e
+        response = await self.request(
+            method="POST",
+            url="/testcase",
+            **self._json_body(testcase_data),
+        )
+        
+        response.raise_for_status()
+        result = self._get_json(response)
+        return result.get("key", "")
 
-    def update_testcase(self, test_case_key: str, testcase_data: dict[str, Any]) -> None:
+    @zephyr_call("Failed to update test case")
+    async def update_testcase(self, test_case_key: str, testcase_data: dict[str, Any]) -> None:
         """Update a test case.
         
         Args:
@@ -92,25 +76,18 @@ class ZephyrTestCaseMixin(
             MCPAtlassianNotFoundError: If test case is not found
             MCPAtlassianError: If update fails
         """
-        try:
-            response = self.request(
-                method="PUT",
-                url=f"/testcase/{test_case_key}",
-                json=testcase_data
-            )
-            
-            if response.status_code == 404:
-                raise MCPAtlassianNotFoundError(f"Test case {test_case_key} not found")
-                
-            response.raise_for_status()
-            
-        except Exception as e:
-            if isinstance(e, (MCPAtlassianNotFoundError, MCPAtlassianError)):
-                raise
-            logger.error(f"Failed to update test case {test_case_key}: {e}")
-            raise MCPAtlassianError(f"Failed to update test case: {e}") from e
+        response = await self.request(
+            method="PUT",
+            url=f"/testcase/{test_case_key}",
+            **self._json_body(testcase_data),
+            not_found_message=f"Test case {test_case_key} not found",
+        )
+        
+        response.raise_for_status()
+        self._forget_revalidated(f"/testcase/{test_case_key}")
 
-    def delete_testcase(self, test_case_key: str) -> None:
+    @zephyr_call("Failed to delete test case")
+    async def delete_testcase(self, test_case_key: str) -> None:
         """Delete a test case.
         
         Args:
@@ -120,24 +97,17 @@ class ZephyrTestCaseMixin(
             MCPAtlassianNotFoundError: If test case is not found
             MCPAtlassianError: If deletion fails
         """
-        try:
-            response = self.request(
-                method="DELETE",
-                url=f"/testcase/{test_case_key}"
-            )
-            
-            if response.status_code == 404:
-                raise MCPAtlassianNotFoundError(f"Test case {test_case_key} not found")
-                
-            response.raise_for_status()
-            
-        except Exception as e:
-            if isinstance(e, (MCPAtlassianNotFoundError, MCPAtlassianError)):
-                raise
-            logger.error(f"Failed to delete test case {test_case_key}: {e}")
-            raise MCPAtlassianError(f"Failed to delete test case: {e}") from e
+        response = await self.request(
+            method="DELETE",
+            url=f"/testcase/{test_case_key}",
+            not_found_message=f"Test case {test_case_key} not found",
+        )
+        
+        response.raise_for_status()
+        self._forget_revalidated(f"/testcase/{test_case_key}")
 
-    def search_testcases(
+    @zephyr_call("Failed to search test cases")
+    async def search_testcases(
         self,
         query: str | None = None,
         fields: str | None = None,
@@ -158,80 +128,37 @@ class ZephyrTestCaseMixin(
         Raises:
             MCPAtlassianError: If search fails
         """
-        try:
-            params = {}
-            if query:
-                params["query"] = query
-            if fields:
-                params["fields"] = fields
-            if start_at > 0:
-                params["startAt"] = start_at
-            if max_results != 200:
-                params["maxResults"] = max_results
-                
-            response = self.request(
-                method="GET",
-                url="/testcase/search",
-                params=params
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            
-            test_cases = []
-            
-            # Handle direct array response from Zephyr API
-            if isinstance(result, list):
-                test_case_data_list = result
-            else:
-                # Handle wrapped response (fallback)
-                test_case_data_list = result.get("results", [])
-            
-            for test_case_data in test_case_data_list:
-                try:
-                    test_case = ZephyrTestCase.from_api_response(test_case_data)
-                    test_cases.append(test_case)
-                except Exception as e:
-                    logger.warning(f"Failed to parse test case data: {e}")
-                    continue
-                    
-            return test_cases
-            
-        except Exception as e:
-            if isinstance(e, MCPAtlassianError):
-                raise
-            logger.error(f"Failed to search test cases: {e}")
-            raise MCPAtlassianError(f"Failed to search test cases: {e}") from e
+        response = await self.request(
+            method="GET",
+            url="/testcase/search",
+            params=self._search_params(query, fields, start_at, max_results)
+        )
+        
+        response.raise_for_status()
+        return ZephyrTestCase.from_list_bytes(response.content)
 
-    def get_testcase_latest_result(self, test_case_key: str) -> dict[str, Any] | None:
-        """Get the latest test result for a test case.
+    async def search_testcases_all(
+        self,
+        query: str | None = None,
+        fields: str | None = None,
+        page_size: int = 200,
+    ) -> list[ZephyrTestCase]:
+        """Search for test cases, returning every page of results.
+        
+        Pages after the first are requested concurrently.
         
         Args:
-            test_case_key: The test case key
+            query: TQL query string for filtering test cases
+            fields: Optional comma-separated list of fields to include
+            page_size: Number of results requested per page
             
         Returns:
-            Latest test result data or None if no results found
+            List of ZephyrTestCase objects
             
         Raises:
-            MCPAtlassianNotFoundError: If test case is not found
-            MCPAtlassianError: If request fails
+            MCPAtlassianError: If any page request fails
         """
-        try:
-            response = self.request(
-                method="GET",
-                url=f"/testcase/{test_case_key}/testresult/latest"
-            )
-            
-            if response.status_code == 404:
-                raise MCPAtlassianNotFoundError(
-                    f"Test case {test_case_key} not found or has no results"
-                )
-                
-            response.raise_for_status()
-            return response.json()
-            
-        except Exception as e:
-            if isinstance(e, (MCPAtlassianNotFoundError, MCPAtlassianError)):
-                raise
-            logger.error(f"Failed to get latest result for test case {test_case_key}: {e}")
-            raise MCPAtlassianError(f"Failed to get latest test result: {e}") from e 
\ No newline at end of file
+        return await self._search_all(
+            lambda start_at: self.search_testcases(query, fields, start_at, page_size),
+            page_size,
+        )
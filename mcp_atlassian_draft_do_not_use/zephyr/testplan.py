@@ -1,15 +1,13 @@
 """Zephyr Test Plan operations mixin."""
 
-import logging
 from typing import Any
 
-from mcp_atlassian.exceptions import MCPAtlassianError, MCPAtlassianNotFoundError
+from mcp_atlassian.exceptions import MCPAtlassianNotFoundError
 from mcp_atlassian.models.zephyr import ZephyrTestPlan
-from mcp_atlassian.zephyr.client import ZephyrClient
+from mcp_atlassian.zephyr.client import ZephyrClient, zephyr_call
+from mcp_atlassian.zephyr.constants import ENTITY_CACHE_TTL
 from mcp_atlassian.zephyr.protocols import ZephyrTestPlanOperationsProto
 
-logger = logging.getLogger("mcp-atlassian.zephyr.testplan")
-
 
 class ZephyrTestPlanMixin(
     ZephyrClient,
@@ -17,7 +15,8 @@ class ZephyrTestPlanMixin(
 ):
     """Mixin providing Zephyr test plan operations."""
 
-    def get_testplan(self, test_plan_key: str, fields: str | None = None) -> ZephyrTestPlan:
+    @zephyr_call("Failed to get test plan")
+    async def get_testplan(self, test_plan_key: str, fields: str | None = None) -> ZephyrTestPlan:
         """Get a test plan by key.
         
         Args:
@@ -31,30 +30,19 @@ class ZephyrTestPlanMixin(
             MCPAtlassianNotFoundError: If test plan is not found
             MCPAtlassianError: If API request fails
         """
-        try:
-            params = {}
-            if fields:
-                params["fields"] = fields
-                
-            response = self.request(
-                method="GET",
-                url=f"/testplan/{test_plan_key}",
-                params=params
-            )
-            
-            if response.status_code == 404:
-                raise MCPAtlassianNotFoundError(f"Test plan {test_plan_key} not found")
-                
-            response.raise_for_status()
-            return ZephyrTestPlan.from_api_response(response.json())
-            
-        except Exception as e:
-            if isinstance(e, (MCPAtlassianNotFoundError, MCPAtlassianError)):
-                raise
-            logger.error(f"Failed to get test plan {test_plan_key}: {e}")
-            raise MCPAtlassianError(f"Failed to get test plan: {e}") from e
+        test_plan = await self._get_revalidated(
+            f"/testplan/{test_plan_key}",
+            ZephyrTestPlan.from_api_bytes,
+            {"fields": fields} if fields else None,
+            max_age=ENTITY_CACHE_TTL,
+        )
+        
+        if test_plan is None:
+            raise MCPAtlassianNotFoundError(f"Test plan {test_plan_key} not found")
+        return test_plan
 
-    def create_testplan(self, testplan_data: dict[str, Any]) -> str:
+    @zephyr_call("Failed to create test plan")
+    async def create_testplan(self, testplan_data: dict[str, Any]) -> str:
         """Create a new test plan.
         
         Args:
@@ -66,22 +54,18 @@ class ZephyrTestPlanMixin(
         Raises:
             MCPAtlassianError: If creation fails
         """
-        try:
-            response = self.request(
-                method="POST",
-                url="/testplan",
-                json=testplan_data
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            return result.get("key", "")
-            
-        except Exception as e:
-            logger.error(f"Failed to create test plan: {e}")
-            raise MCPAtlassianError(f"Failed to create test plan: {e}") from e
+        response = await self.request(
+            method="POST",
+            url="/testplan",
+            **self._json_body(testplan_data),
+        )
+        
+        response.raise_for_status()
+        result = self._get_json(response)
+        return result.get("key", "")
 
-    def update_testplan(self, test_plan_key: str, testplan_data: dict[str, Any]) -> None:
+    @zephyr_call("Failed to update test plan")
+    async def update_testplan(self, test_plan_key: str, testplan_data: dict[str, Any]) -> None:
         """Update a test plan.
         
         Args:
@@ -92,25 +76,18 @@ class ZephyrTestPlanMixin(
             MCPAtlassianNotFoundError: If test plan is not found
             MCPAtlassianError: If update fails
         """
-        try:
-            response = self.request(
-                method="PUT",
-                url=f"/testplan/{test_plan_key}",
-                json=testplan_data
-            )
-            
-            if response.status_code == 404:
-                raise MCPAtlassianNotFoundError(f"Test plan {test_plan_key} not found")
-                
-            response.raise_for_status()
-            
-        except Exception as e:
-            if isinstance(e, (MCPAtlassianNotFoundError, MCPAtlassianError)):
-                raise
-            logger.error(f"Failed to update test plan {test_plan_key}: {e}")
-            raise MCPAtlassianError(f"Failed to update test plan: {e}") from e
+        response = await self.request(
+            method="PUT",
+            url=f"/testplan/{test_plan_key}",
+            **self._json_body(testplan_data),
+            not_found_message=f"Test plan {test_plan_key} not found",
+        )
+        
+        response.raise_for_status()
+        self._forget_revalidated(f"/testplan/{test_plan_key}")
 
-    def delete_testplan(self, test_plan_key: str) -> None:
+    @zephyr_call("Failed to delete test plan")
+    async def delete_testplan(self, test_plan_key: str) -> None:
         """Delete a test plan.
         
         Args:
@@ -120,24 +97,17 @@ class ZephyrTestPlanMixin(
             MCPAtlassianNotFoundError: If test plan is not found
             MCPAtlassianError: If deletion fails
         """
-        try:
-            response = self.request(
-                method="DELETE",
-                url=f"/testplan/{test_plan_key}"
-            )
-            
-            if response.status_code == 404:
-                raise MCPAtlassianNotFoundError(f"Test plan {test_plan_key} not found")
-                
-            response.raise_for_status()
-            
-        except Exception as e:
-            if isinstance(e, (MCPAtlassianNotFoundError, MCPAtlassianError)):
-                raise
-            logger.error(f"Failed to delete test plan {test_plan_key}: {e}")
-            raise MCPAtlassianError(f"Failed to delete test plan: {e}") from e
+        response = await self.request(
+            method="DELETE",
+            url=f"/testplan/{test_plan_key}",
+            not_found_message=f"Test plan {test_plan_key} not found",
+        )
+        
+        response.raise_for_status()
+        self._forget_revalidated(f"/testplan/{test_plan_key}")
 
-    def search_testplans(
+    @zephyr_call("Failed to search test plans")
+    async def search_testplans(
         self,
         query: str | None = None,
         fields: str | None = None,
@@ -158,47 +128,37 @@ class ZephyrTestPlanMixin(
         Raises:
             MCPAtlassianError: If search fails
         """
-        try:
-            params = {}
-            if query:
-                params["query"] = query
-            if fields:
-                params["fields"] = fields
-            if start_at > 0:
-                params["startAt"] = start_at
-            if max_results != 200:
-                params["maxResults"] = max_results
-                
-            response = self.request(
-                method="GET",
-                url="/testplan/search",
-                params=params
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            
-            test_plans = []
-            
-            # Handle direct array response from Zephyr API
-            if isinstance(result, list):
-                test_plan_data_list = result
-            else:
-                # Handle wrapped response (fallback)
-                test_plan_data_list = result.get("results", [])
+        response = await self.request(
+            method="GET",
+            url="/testplan/search",
+            params=self._search_params(query, fields, start_at, max_results)
+        )
+        
+        response.raise_for_status()
+        return ZephyrTestPlan.from_list_bytes(response.content)
+
+    async def search_testplans_all(
+        self,
+        query: str | None = None,
+        fields: str | None = None,
+        page_size: int = 200,
+    ) -> list[ZephyrTestPlan]:
+        """Search for test plans, returning every page of results.
+        
+        Pages after the first are requested concurrently.
+        
+        Args:
+            query: TQL query string for filtering test plans
+            fields: Optional comma-separated list of fields to include
+            page_size: Number of results requested per page
             
-            for test_plan_data in test_plan_data_list:
-                try:
-                    test_plan = ZephyrTestPlan.from_api_response(test_plan_data)
-                    test_plans.append(test_plan)
-                except Exception as e:
-                    logger.warning(f"Failed to parse test plan data: {e}")
-                    continue
-                    
-            return test_plans
+        Returns:
+            List of ZephyrTestPlan objects
             
-        except Exception as e:
-            if isinstance(e, MCPAtlassianError):
-                raise
-            logger.error(f"Failed to search test plans: {e}")
-            raise MCPAtlassianError(f"Failed to search test plans: {e}") from e 
\ No newline at end of file
+        Raises:
+            MCPAtlassianError: If any page request fails
+        """
+        return await self._search_all(
+            lambda start_at: self.search_testplans(query, fields, start_at, page_size),
+            page_size,
+        )
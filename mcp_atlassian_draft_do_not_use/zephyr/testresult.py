@@ -1,15 +1,16 @@
 """Zephyr Test Result operations mixin."""
 
-import logging
+import asyncio
+from collections.abc import Sequence
 from typing import Any
 
-from mcp_atlassian.exceptions import MCPAtlassianError, MCPAtlassianNotFoundError
+from mcp_atlassian.exceptions import MCPAtlassianBulkCreateError, MCPAtlassianNotFoundError
 from mcp_atlassian.models.zephyr import ZephyrTestResult
-from mcp_atlassian.zephyr.client import ZephyrClient
+from mcp_atlassian.zephyr.batching import BatchingTestResultWriter
+from mcp_atlassian.zephyr.client import ZephyrClient, zephyr_call
+from mcp_atlassian.zephyr.constants import BULK_GZIP_THRESHOLD
 from mcp_atlassian.zephyr.protocols import ZephyrTestResultOperationsProto
 
-logger = logging.getLogger("mcp-atlassian.zephyr.testresult")
-
 
 class ZephyrTestResultMixin(
     ZephyrClient,
@@ -17,7 +18,8 @@ class ZephyrTestResultMixin(
 ):
     """Mixin providing Zephyr test result operations."""
 
-    def create_testresult(self, testresult_data: dict[str, Any]) -> int:
+    @zephyr_call("Failed to create test result")
+    async def create_testresult(self, testresult_data: dict[str, Any]) -> int:
         """Create a new test result for a test case.
         
         Args:
@@ -29,22 +31,18 @@ class ZephyrTestResultMixin(
         Raises:
             MCPAtlassianError: If creation fails
         """
-        try:
-            response = self.request(
-                method="POST",
-                url="/testresult",
-                json=testresult_data
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            return result.get("id", 0)
-            
-        except Exception as e:
-            logger.error(f"Failed to create test result: {e}")
-            raise MCPAtlassianError(f"Failed to create test result: {e}") from e
+        response = await self.request(
+            method="POST",
+            url="/testresult",
+            **self._json_body(testresult_data),
+        )
+        
+        response.raise_for_status()
+        result = self._get_json(response)
+        return result.get("id", 0)
 
-    def get_testcase_latest_result(self, test_case_key: str) -> ZephyrTestResult | None:
+    @zephyr_call("Failed to get latest test result")
+    async def get_testcase_latest_result(self, test_case_key: str) -> ZephyrTestResult | None:
         """Get the latest test result for a test case.
         
         Args:
@@ -57,26 +55,37 @@ class ZephyrTestResultMixin(
             MCPAtlassianNotFoundError: If test case is not found
             MCPAtlassianError: If request fails
         """
-        try:
-            response = self.request(
-                method="GET",
-                url=f"/testcase/{test_case_key}/testresult/latest"
-            )
+        return await self._get_revalidated(
+            f"/testcase/{test_case_key}/testresult/latest",
+            ZephyrTestResult.from_api_bytes,
+        )
+
+    async def get_testcase_latest_results(
+        self, test_case_keys: Sequence[str]
+    ) -> list[ZephyrTestResult | None]:
+        """Get the latest test results for several test cases concurrently.
+        
+        All requests are in flight at once over the shared connection pool,
+        so the total wait is roughly one round trip rather than one per key.
+        
+        Args:
+            test_case_keys: The test case keys
             
-            if response.status_code == 404:
-                return None
-                
-            response.raise_for_status()
-            result_data = response.json()
-            return ZephyrTestResult.from_api_response(result_data)
+        Returns:
+            The latest result for each key, in the order of test_case_keys
+            (None where a test case has no results)
             
-        except Exception as e:
-            if isinstance(e, MCPAtlassianError):
-                raise
-            logger.error(f"Failed to get latest result for test case {test_case_key}: {e}")
-            raise MCPAtlassianError(f"Failed to get latest test result: {e}") from e
+        Raises:
+            MCPAtlassianError: If any request fails
+        """
+        return list(
+            await asyncio.gather(
+                *(self.get_testcase_latest_result(key) for key in test_case_keys)
+            )
+        )
 
-    def get_testrun_results(self, test_run_key: str) -> list[ZephyrTestResult]:
+    @zephyr_call("Failed to get test run results")
+    async def get_testrun_results(self, test_run_key: str) -> list[ZephyrTestResult]:
         """Get all test results for a test run.
         
         Args:
@@ -89,44 +98,17 @@ class ZephyrTestResultMixin(
             MCPAtlassianNotFoundError: If test run is not found
             MCPAtlassianError: If request fails
         """
-        try:
-            response = self.request(
-                method="GET",
-                url=f"/testrun/{test_run_key}/testresults"
-            )
-            
-            if response.status_code == 404:
-                raise MCPAtlassianNotFoundError(f"Test run {test_run_key} not found")
-                
-            response.raise_for_status()
-            result = response.json()
-            
-            test_results = []
-            
-            # Handle direct array response from Zephyr API
-            if isinstance(result, list):
-                result_data_list = result
-            else:
-                # Handle wrapped response (fallback)
-                result_data_list = result.get("results", [])
-            
-            for result_data in result_data_list:
-                try:
-                    test_result = ZephyrTestResult.from_api_response(result_data)
-                    test_results.append(test_result)
-                except Exception as e:
-                    logger.warning(f"Failed to parse test result data: {e}")
-                    continue
-                    
-            return test_results
-            
-        except Exception as e:
-            if isinstance(e, (MCPAtlassianNotFoundError, MCPAtlassianError)):
-                raise
-            logger.error(f"Failed to get test results for test run {test_run_key}: {e}")
-            raise MCPAtlassianError(f"Failed to get test run results: {e}") from e
+        test_results = await self._get_revalidated(
+            f"/testrun/{test_run_key}/testresults", ZephyrTestResult.from_list_bytes
+        )
+        
+        if test_results is None:
+            raise MCPAtlassianNotFoundError(f"Test run {test_run_key} not found")
+        # The cached list is shared between calls; hand out a copy
+        return list(test_results)
 
-    def create_testrun_result(
+    @zephyr_call("Failed to create test result")
+    async def create_testrun_result(
         self,
         test_run_key: str,
         test_case_key: str,
@@ -149,29 +131,20 @@ class ZephyrTestResultMixin(
         Raises:
             MCPAtlassianError: If creation fails
         """
-        try:
-            params = {}
-            if environment:
-                params["environment"] = environment
-            if user_key:
-                params["userKey"] = user_key
-                
-            response = self.request(
-                method="POST",
-                url=f"/testrun/{test_run_key}/testcase/{test_case_key}/testresult",
-                json=testresult_data,
-                params=params
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            return result.get("id", 0)
-            
-        except Exception as e:
-            logger.error(f"Failed to create test result for {test_case_key} in {test_run_key}: {e}")
-            raise MCPAtlassianError(f"Failed to create test result: {e}") from e
+        response = await self.request(
+            method="POST",
+            url=f"/testrun/{test_run_key}/testcase/{test_case_key}/testresult",
+            **self._json_body(testresult_data),
+            params=self._result_params(environment, user_key)
+        )
+        
+        response.raise_for_status()
+        self._forget_revalidated(f"/testrun/{test_run_key}")
+        result = self._get_json(response)
+        return result.get("id", 0)
 
-    def update_testrun_result(
+    @zephyr_call("Failed to update test result")
+    async def update_testrun_result(
         self,
         test_run_key: str,
         test_case_key: str,
@@ -194,29 +167,112 @@ class ZephyrTestResultMixin(
         Raises:
             MCPAtlassianError: If update fails
         """
-        try:
-            params = {}
-            if environment:
-                params["environment"] = environment
-            if user_key:
-                params["userKey"] = user_key
-                
-            response = self.request(
-                method="PUT",
-                url=f"/testrun/{test_run_key}/testcase/{test_case_key}/testresult",
-                json=testresult_data,
-                params=params
+        response = await self.request(
+            method="PUT",
+            url=f"/testrun/{test_run_key}/testcase/{test_case_key}/testresult",
+            **self._json_body(testresult_data),
+            params=self._result_params(environment, user_key)
+        )
+        
+        response.raise_for_status()
+        self._forget_revalidated(f"/testrun/{test_run_key}")
+        result = self._get_json(response)
+        return result.get("id", 0)
+
+    async def create_testrun_results(
+        self,
+        test_run_key: str,
+        results: Sequence[tuple[str, dict[str, Any]]],
+        environment: str | None = None,
+        user_key: str | None = None,
+    ) -> list[int]:
+        """Create test results for several test cases of a test run.
+        
+        The results are coalesced by BatchingTestResultWriter into bulk
+        create requests, so up to 200 results take a single round trip.
+        
+        Each bulk request is all-or-nothing: if it fails, or the server
+        returns fewer IDs than results, every result in it is reported as
+        failed, even though the server may already have created some of
+        them. Check the created_ids of the raised error before retrying, or
+        the retry may create duplicates.
+        
+        Args:
+            test_run_key: The test run key
+            results: (test case key, test result data) pairs
+            environment: Optional environment filter
+            user_key: Optional user key filter
+            
+        Returns:
+            IDs of the created test results, in the order of results
+            
+        Raises:
+            MCPAtlassianBulkCreateError: If any bulk request fails; created_ids
+                holds every ID the server returned, including those of
+                batches that succeeded
+        """
+        # Every result is queued before the zero-delay timer fires, so each
+        # batch is only cut short by max_batch
+        async with BatchingTestResultWriter(self, flush_interval=0) as writer:
+            outcomes = await asyncio.gather(
+                *(
+                    writer.create_testrun_result(
+                        test_run_key, test_case_key, data, environment, user_key
+                    )
+                    for test_case_key, data in results
+                ),
+                return_exceptions=True,
             )
+        
+        errors = [o for o in outcomes if isinstance(o, BaseException)]
+        if not errors:
+            return list(outcomes)
+        
+        created_ids = [o for o in outcomes if not isinstance(o, BaseException)]
+        # Results of one failed batch share a single exception instance
+        for error in {id(e): e for e in errors}.values():
+            if isinstance(error, MCPAtlassianBulkCreateError):
+                created_ids.extend(error.created_ids)
+        raise MCPAtlassianBulkCreateError(
+            f"Failed to create {len(errors)} of {len(outcomes)} test results "
+            f"for {test_run_key}: {errors[0]}",
+            created_ids=created_ids,
+        ) from errors[0]
+
+    async def update_testrun_results(
+        self,
+        test_run_key: str,
+        results: Sequence[tuple[str, dict[str, Any]]],
+        environment: str | None = None,
+        user_key: str | None = None,
+    ) -> list[int]:
+        """Update the latest test results of several test cases concurrently.
+        
+        Args:
+            test_run_key: The test run key
+            results: (test case key, test result data) pairs
+            environment: Optional environment filter
+            user_key: Optional user key filter
             
-            response.raise_for_status()
-            result = response.json()
-            return result.get("id", 0)
+        Returns:
+            IDs of the updated test results, in the order of results
             
-        except Exception as e:
-            logger.error(f"Failed to update test result for {test_case_key} in {test_run_key}: {e}")
-            raise MCPAtlassianError(f"Failed to update test result: {e}") from e
+        Raises:
+            MCPAtlassianError: If any update fails
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.update_testrun_result(
+                        test_run_key, test_case_key, data, environment, user_key
+                    )
+                    for test_case_key, data in results
+                )
+            )
+        )
 
-    def create_bulk_testrun_results(
+    @zephyr_call("Failed to create bulk test results")
+    async def create_bulk_testrun_results(
         self,
         test_run_key: str,
         testresults_data: list[dict[str, Any]],
@@ -237,24 +293,18 @@ class ZephyrTestResultMixin(
         Raises:
             MCPAtlassianError: If creation fails
         """
-        try:
-            params = {}
-            if environment:
-                params["environment"] = environment
-            if user_key:
-                params["userKey"] = user_key
-                
-            response = self.request(
-                method="POST",
-                url=f"/testrun/{test_run_key}/testresults",
-                json=testresults_data,
-                params=params
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            return result.get("ids", [])
-            
-        except Exception as e:
-            logger.error(f"Failed to create bulk test results for {test_run_key}: {e}")
-            raise MCPAtlassianError(f"Failed to create bulk test results: {e}") from e 
\ No newline at end of file
+        response = await self.request(
+            method="POST",
+            url=f"/testrun/{test_run_key}/testresults",
+            params=self._result_params(environment, user_key),
+            **self._json_body(
+                testresults_data,
+                compress=self.config.compress_requests
+                and len(testresults_data) > BULK_GZIP_THRESHOLD,
+            ),
+        )
+        
+        response.raise_for_status()
+        self._forget_revalidated(f"/testrun/{test_run_key}")
+        result = self._get_json(response)
+        return result.get("ids", [])
@@ -1,15 +1,14 @@
 """Zephyr Test Run operations mixin."""
 
-import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
-from mcp_atlassian.exceptions import MCPAtlassianError, MCPAtlassianNotFoundError
+from mcp_atlassian.exceptions import MCPAtlassianNotFoundError
 from mcp_atlassian.models.zephyr import ZephyrTestResult, ZephyrTestRun
-from mcp_atlassian.zephyr.client import ZephyrClient
+from mcp_atlassian.zephyr.client import ZephyrClient, zephyr_call
+from mcp_atlassian.zephyr.constants import BULK_GZIP_THRESHOLD, ENTITY_CACHE_TTL
 from mcp_atlassian.zephyr.protocols import ZephyrTestResultOperationsProto, ZephyrTestRunOperationsProto
 
-logger = logging.getLogger("mcp-atlassian.zephyr.testrun")
-
 
 class ZephyrTestRunMixin(
     ZephyrClient,
@@ -18,7 +17,8 @@ class ZephyrTestRunMixin(
 ):
     """Mixin providing Zephyr test run operations."""
 
-    def get_testrun(self, test_run_key: str, fields: str | None = None) -> ZephyrTestRun:
+    @zephyr_call("Failed to get test run")
+    async def get_testrun(self, test_run_key: str, fields: str | None = None) -> ZephyrTestRun:
         """Get a test run by key.
         
         Args:
@@ -32,30 +32,19 @@ class ZephyrTestRunMixin(
             MCPAtlassianNotFoundError: If test run is not found
             MCPAtlassianError: If API request fails
         """
-        try:
-            params = {}
-            if fields:
-                params["fields"] = fields
-                
-            response = self.request(
-                method="GET",
-                url=f"/testrun/{test_run_key}",
-                params=params
-            )
-            
-            if response.status_code == 404:
-                raise MCPAtlassianNotFoundError(f"Test run {test_run_key} not found")
-                
-            response.raise_for_status()
-            return ZephyrTestRun.from_api_response(response.json())
-            
-        except Exception as e:
-            if isinstance(e, (MCPAtlassianNotFoundError, MCPAtlassianError)):
-                raise
-            logger.error(f"Failed to get test run {test_run_key}: {e}")
-            raise MCPAtlassianError(f"Failed to get test run: {e}") from e
+        test_run = await self._get_revalidated(
+            f"/testrun/{test_run_key}",
+            ZephyrTestRun.from_api_bytes,
+            {"fields": fields} if fields else None,
+            max_age=ENTITY_CACHE_TTL,
+        )
+        
+        if test_run is None:
+            raise MCPAtlassianNotFoundError(f"Test run {test_run_key} not found")
+        return test_run
 
-    def create_testrun(self, testrun_data: dict[str, Any]) -> str:
+    @zephyr_call("Failed to create test run")
+    async def create_testrun(self, testrun_data: dict[str, Any]) -> str:
         """Create a new test run.
         
         Args:
@@ -67,22 +56,18 @@ class ZephyrTestRunMixin(
         Raises:
             MCPAtlassianError: If creation fails
         """
-        try:
-            response = self.request(
-                method="POST",
-                url="/testrun",
-                json=testrun_data
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            return result.get("key", "")
-            
-        except Exception as e:
-            logger.error(f"Failed to create test run: {e}")
-            raise MCPAtlassianError(f"Failed to create test run: {e}") from e
+        response = await self.request(
+            method="POST",
+            url="/testrun",
+            **self._json_body(testrun_data),
+        )
+        
+        response.raise_for_status()
+        result = self._get_json(response)
+        return result.get("key", "")
 
-    def delete_testrun(self, test_run_key: str) -> None:
+    @zephyr_call("Failed to delete test run")
+    async def delete_testrun(self, test_run_key: str) -> None:
         """Delete a test run.
         
         Args:
@@ -92,24 +77,17 @@ class ZephyrTestRunMixin(
             MCPAtlassianNotFoundError: If test run is not found
             MCPAtlassianError: If deletion fails
         """
-        try:
-            response = self.request(
-                method="DELETE",
-                url=f"/testrun/{test_run_key}"
-            )
-            
-            if response.status_code == 404:
-                raise MCPAtlassianNotFoundError(f"Test run {test_run_key} not found")
-                
-            response.raise_for_status()
-            
-        except Exception as e:
-            if isinstance(e, (MCPAtlassianNotFoundError, MCPAtlassianError)):
-                raise
-            logger.error(f"Failed to delete test run {test_run_key}: {e}")
-            raise MCPAtlassianError(f"Failed to delete test run: {e}") from e
+        response = await self.request(
+            method="DELETE",
+            url=f"/testrun/{test_run_key}",
+            not_found_message=f"Test run {test_run_key} not found",
+        )
+        
+        response.raise_for_status()
+        self._forget_revalidated(f"/testrun/{test_run_key}")
 
-    def search_testruns(
+    @zephyr_call("Failed to search test runs")
+    async def search_testruns(
         self,
         query: str | None = None,
         fields: str | None = None,
@@ -130,52 +108,44 @@ class ZephyrTestRunMixin(
         Raises:
             MCPAtlassianError: If search fails
         """
-        try:
-            params = {}
-            if query:
-                params["query"] = query
-            if fields:
-                params["fields"] = fields
-            if start_at > 0:
-                params["startAt"] = start_at
-            if max_results != 200:
-                params["maxResults"] = max_results
-                
-            response = self.request(
-                method="GET",
-                url="/testrun/search",
-                params=params
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            
-            test_runs = []
-            
-            # Handle direct array response from Zephyr API
-            if isinstance(result, list):
-                test_run_data_list = result
-            else:
-                # Handle wrapped response (fallback)
-                test_run_data_list = result.get("results", [])
+        response = await self.request(
+            method="GET",
+            url="/testrun/search",
+            params=self._search_params(query, fields, start_at, max_results)
+        )
+        
+        response.raise_for_status()
+        return ZephyrTestRun.from_list_bytes(response.content)
+
+    def iter_all_testruns(
+        self,
+        query: str | None = None,
+        fields: str | None = None,
+        page_size: int = 200,
+    ) -> AsyncIterator[ZephyrTestRun]:
+        """Iterate over every test run matching a search.
+        
+        The next page is requested while the current one is being consumed,
+        so page latency overlaps with the caller's processing.
+        
+        Args:
+            query: TQL query string for filtering test runs
+            fields: Optional comma-separated list of fields to include
+            page_size: Number of results requested per page
             
-            for test_run_data in test_run_data_list:
-                try:
-                    test_run = ZephyrTestRun.from_api_response(test_run_data)
-                    test_runs.append(test_run)
-                except Exception as e:
-                    logger.warning(f"Failed to parse test run data: {e}")
-                    continue
-                    
-            return test_runs
+        Returns:
+            Async iterator of ZephyrTestRun objects
             
-        except Exception as e:
-            if isinstance(e, MCPAtlassianError):
-                raise
-            logger.error(f"Failed to search test runs: {e}")
-            raise MCPAtlassianError(f"Failed to search test runs: {e}") from e
+        Raises:
+            MCPAtlassianError: If any page request fails
+        """
+        return self._iter_search(
+            lambda start_at: self.search_testruns(query, fields, start_at, page_size),
+            page_size,
+        )
 
-    def get_testrun_results(self, test_run_key: str) -> list[ZephyrTestResult]:
+    @zephyr_call("Failed to get test run results")
+    async def get_testrun_results(self, test_run_key: str) -> list[ZephyrTestResult]:
         """Get all test results for a test run.
         
         Args:
@@ -188,44 +158,17 @@ class ZephyrTestRunMixin(
             MCPAtlassianNotFoundError: If test run is not found
             MCPAtlassianError: If request fails
         """
-        try:
-            response = self.request(
-                method="GET",
-                url=f"/testrun/{test_run_key}/testresults"
-            )
-            
-            if response.status_code == 404:
-                raise MCPAtlassianNotFoundError(f"Test run {test_run_key} not found")
-                
-            response.raise_for_status()
-            result = response.json()
-            
-            test_results = []
-            
-            # Handle direct array response from Zephyr API
-            if isinstance(result, list):
-                result_data_list = result
-            else:
-                # Handle wrapped response (fallback)
-                result_data_list = result.get("results", [])
-            
-            for result_data in result_data_list:
-                try:
-                    test_result = ZephyrTestResult.from_api_response(result_data)
-                    test_results.append(test_result)
-                except Exception as e:
-                    logger.warning(f"Failed to parse test result data: {e}")
-                    continue
-                    
-            return test_results
-            
-        except Exception as e:
-            if isinstance(e, (MCPAtlassianNotFoundError, MCPAtlassianError)):
-                raise
-            logger.error(f"Failed to get test results for test run {test_run_key}: {e}")
-            raise MCPAtlassianError(f"Failed to get test run results: {e}") from e
+        test_results = await self._get_revalidated(
+            f"/testrun/{test_run_key}/testresults", ZephyrTestResult.from_list_bytes
+        )
+        
+        if test_results is None:
+            raise MCPAtlassianNotFoundError(f"Test run {test_run_key} not found")
+        # The cached list is shared between calls; hand out a copy
+        return list(test_results)
 
-    def create_testrun_result(
+    @zephyr_call("Failed to create test result")
+    async def create_testrun_result(
         self,
         test_run_key: str,
         test_case_key: str,
@@ -248,29 +191,20 @@ class ZephyrTestRunMixin(
         Raises:
             MCPAtlassianError: If creation fails
         """
-        try:
-            params = {}
-            if environment:
-                params["environment"] = environment
-            if user_key:
-                params["userKey"] = user_key
-                
-            response = self.request(
-                method="POST",
-                url=f"/testrun/{test_run_key}/testcase/{test_case_key}/testresult",
-                json=testresult_data,
-                params=params
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            return result.get("id", 0)
-            
-        except Exception as e:
-            logger.error(f"Failed to create test result for {test_case_key} in {test_run_key}: {e}")
-            raise MCPAtlassianError(f"Failed to create test result: {e}") from e
+        response = await self.request(
+            method="POST",
+            url=f"/testrun/{test_run_key}/testcase/{test_case_key}/testresult",
+            **self._json_body(testresult_data),
+            params=self._result_params(environment, user_key)
+        )
+        
+        response.raise_for_status()
+        self._forget_revalidated(f"/testrun/{test_run_key}")
+        result = self._get_json(response)
+        return result.get("id", 0)
 
-    def update_testrun_result(
+    @zephyr_call("Failed to update test result")
+    async def update_testrun_result(
         self,
         test_run_key: str,
         test_case_key: str,
@@ -293,29 +227,20 @@ class ZephyrTestRunMixin(
         Raises:
             MCPAtlassianError: If update fails
         """
-        try:
-            params = {}
-            if environment:
-                params["environment"] = environment
-            if user_key:
-                params["userKey"] = user_key
-                
-            response = self.request(
-                method="PUT",
-                url=f"/testrun/{test_run_key}/testcase/{test_case_key}/testresult",
-                json=testresult_data,
-                params=params
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            return result.get("id", 0)
-            
-        except Exception as e:
-            logger.error(f"Failed to update test result for {test_case_key} in {test_run_key}: {e}")
-            raise MCPAtlassianError(f"Failed to update test result: {e}") from e
+        response = await self.request(
+            method="PUT",
+            url=f"/testrun/{test_run_key}/testcase/{test_case_key}/testresult",
+            **self._json_body(testresult_data),
+            params=self._result_params(environment, user_key)
+        )
+        
+        response.raise_for_status()
+        self._forget_revalidated(f"/testrun/{test_run_key}")
+        result = self._get_json(response)
+        return result.get("id", 0)
 
-    def create_bulk_testrun_results(
+    @zephyr_call("Failed to create bulk test results")
+    async def create_bulk_testrun_results(
         self,
         test_run_key: str,
         testresults_data: list[dict[str, Any]],
@@ -336,24 +261,18 @@ class ZephyrTestRunMixin(
         Raises:
             MCPAtlassianError: If creation fails
         """
-        try:
-            params = {}
-            if environment:
-                params["environment"] = environment
-            if user_key:
-                params["userKey"] = user_key
-                
-            response = self.request(
-                method="POST",
-                url=f"/testrun/{test_run_key}/testresults",
-                json=testresults_data,
-                params=params
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            return result.get("ids", [])
-            
-        except Exception as e:
-            logger.error(f"Failed to create bulk test results for {test_run_key}: {e}")
-            raise MCPAtlassianError(f"Failed to create bulk test results: {e}") from e 
\ No newline at end of file
+        response = await self.request(
+            method="POST",
+            url=f"/testrun/{test_run_key}/testresults",
+            params=self._result_params(environment, user_key),
+            **self._json_body(
+                testresults_data,
+                compress=self.config.compress_requests
+                and len(testresults_data) > BULK_GZIP_THRESHOLD,
+            ),
+        )
+        
+        response.raise_for_status()
+        self._forget_revalidated(f"/testrun/{test_run_key}")
+        result = self._get_json(response)
+        return result.get("ids", [])
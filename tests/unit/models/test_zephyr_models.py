@@ -0,0 +1,14 @@
+"""Tests for the Zephyr API models."""
+
+from mcp_atlassian.models.zephyr import ZephyrTestPlan
+
+
+def test_from_api_bytes_falls_back_on_invalid_body():
+    """A body that fails validation is still parsed leniently."""
+    test_plan = ZephyrTestPlan.from_api_bytes(
+        b'{"key": "PROJ-P1", "name": "Plan", "testRuns": null}'
+    )
+
+    assert test_plan.key == "PROJ-P1"
+    assert test_plan.name == "Plan"
+    assert test_plan.to_simplified_dict()["test_runs_count"] == 0
@@ -0,0 +1,131 @@
+"""Tests for the coalescing test result writer."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from mcp_atlassian.exceptions import MCPAtlassianBulkCreateError
+from mcp_atlassian.zephyr import BatchingTestResultWriter
+
+
+class FakeFetcher:
+    """Records bulk create calls and returns sequential IDs."""
+
+    def __init__(self, short_by: int = 0) -> None:
+        self.calls: list[tuple[str, list[dict[str, Any]], str | None, str | None]] = []
+        self.short_by = short_by
+        self.next_id = 100
+
+    async def create_bulk_testrun_results(
+        self,
+        test_run_key: str,
+        testresults_data: list[dict[str, Any]],
+        environment: str | None = None,
+        user_key: str | None = None,
+    ) -> list[int]:
+        self.calls.append((test_run_key, testresults_data, environment, user_key))
+        ids = list(range(self.next_id, self.next_id + len(testresults_data)))
+        self.next_id += len(testresults_data)
+        return ids[: len(ids) - self.short_by]
+
+
+def test_ids_are_matched_to_results_by_position():
+    """Each caller gets the ID at its result's position in the batch."""
+    fetcher = FakeFetcher()
+
+    async def run() -> list[int]:
+        async with BatchingTestResultWriter(fetcher, flush_interval=0.01) as writer:
+            return await asyncio.gather(
+                *(
+                    writer.create_testrun_result("RUN-1", f"T-{i}", {"status": "Pass"})
+                    for i in range(3)
+                ),
+                writer.create_testrun_result("RUN-1", "T-9", {}, environment="Chrome"),
+            )
+
+    ids = asyncio.run(run())
+
+    assert len(fetcher.calls) == 2
+    run_key, payloads, environment, _ = fetcher.calls[0]
+    assert (run_key, environment) == ("RUN-1", None)
+    assert [p["testCaseKey"] for p in payloads] == ["T-0", "T-1", "T-2"]
+    assert fetcher.calls[1][1] == [{"testCaseKey": "T-9"}]
+    assert fetcher.calls[1][2] == "Chrome"
+    assert ids == [100, 101, 102, 103]
+
+
+def test_short_id_list_fails_every_result_in_the_batch():
+    """A bulk response with fewer IDs than results fails the whole batch."""
+    fetcher = FakeFetcher(short_by=1)
+
+    async def run() -> list[Any]:
+        async with BatchingTestResultWriter(fetcher, flush_interval=0.01) as writer:
+            return await asyncio.gather(
+                writer.create_testrun_result("RUN-1", "T-1", {}),
+                writer.create_testrun_result("RUN-1", "T-2", {}),
+                return_exceptions=True,
+            )
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(r, MCPAtlassianBulkCreateError) for r in results)
+    assert results[0].created_ids == [100]
+
+
+def test_full_batch_is_sent_without_waiting_for_the_timer():
+    """Reaching max_batch sends the batch before flush_interval elapses."""
+    fetcher = FakeFetcher()
+
+    async def run() -> list[int]:
+        writer = BatchingTestResultWriter(fetcher, max_batch=2, flush_interval=60)
+        return await asyncio.wait_for(
+            asyncio.gather(
+                writer.create_testrun_result("RUN-1", "T-1", {}),
+                writer.create_testrun_result("RUN-1", "T-2", {}),
+            ),
+            timeout=1,
+        )
+
+    assert asyncio.run(run()) == [100, 101]
+    assert len(fetcher.calls) == 1
+
+
+def test_partial_batch_is_sent_when_the_timer_fires():
+    """A batch below max_batch is sent flush_interval after its first result."""
+    fetcher = FakeFetcher()
+
+    async def run() -> int:
+        writer = BatchingTestResultWriter(fetcher, max_batch=10, flush_interval=0.01)
+        return await asyncio.wait_for(
+            writer.create_testrun_result("RUN-1", "T-1", {}), timeout=1
+        )
+
+    assert asyncio.run(run()) == 100
+    assert len(fetcher.calls) == 1
+
+
+def test_flush_with_nothing_pending_is_a_no_op():
+    """Flushing an empty writer sends nothing."""
+    fetcher = FakeFetcher()
+    asyncio.run(BatchingTestResultWriter(fetcher).flush())
+    assert fetcher.calls == []
+
+
+@pytest.mark.parametrize("max_batch", [1, 3])
+def test_batches_never_exceed_max_batch(max_batch: int):
+    """Results beyond max_batch start a new batch."""
+    fetcher = FakeFetcher()
+
+    async def run() -> None:
+        async with BatchingTestResultWriter(
+            fetcher, max_batch=max_batch, flush_interval=0.01
+        ) as writer:
+            await asyncio.gather(
+                *(writer.create_testrun_result("RUN-1", f"T-{i}", {}) for i in range(5))
+            )
+
+    asyncio.run(run())
+
+    assert all(len(payloads) <= max_batch for _, payloads, _, _ in fetcher.calls)
+    assert sum(len(payloads) for _, payloads, _, _ in fetcher.calls) == 5
@@ -0,0 +1,95 @@
+"""Tests for the combined ZephyrFetcher."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from mcp_atlassian.exceptions import MCPAtlassianBulkCreateError
+from mcp_atlassian.models.zephyr import ZephyrTestResult
+from mcp_atlassian.servers.dependencies import ZephyrFetcher
+from mcp_atlassian.zephyr import ZephyrConfig, ZephyrTestResultMixin
+
+
+def _fetcher(handler) -> ZephyrFetcher:
+    """Build a fetcher whose HTTP client is served by handler."""
+    fetcher = ZephyrFetcher(
+        config=ZephyrConfig(api_token="token", base_url="https://zephyr.example.com")
+    )
+    fetcher._http_client = httpx.AsyncClient(
+        base_url=fetcher.config.base_url, transport=httpx.MockTransport(handler)
+    )
+    return fetcher
+
+
+def test_latest_result_methods_resolve_to_result_mixin():
+    """The fetcher uses the ZephyrTestResult-returning implementations."""
+    assert (
+        ZephyrFetcher.get_testcase_latest_result
+        is ZephyrTestResultMixin.get_testcase_latest_result
+    )
+    assert (
+        ZephyrFetcher.get_testcase_latest_results
+        is ZephyrTestResultMixin.get_testcase_latest_results
+    )
+
+
+def test_get_testcase_latest_results():
+    """Latest results come back as models, with None for missing results."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/testcase/PROJ-T1/testresult/latest":
+            return httpx.Response(
+                200,
+                json={"id": 7, "testCaseKey": "PROJ-T1", "status": "Pass"},
+            )
+        return httpx.Response(404)
+
+    fetcher = _fetcher(handler)
+    results = asyncio.run(
+        fetcher.get_testcase_latest_results(["PROJ-T1", "PROJ-T2"])
+    )
+
+    assert isinstance(results[0], ZephyrTestResult)
+    assert results[0].id == 7
+    assert results[0].test_case_key == "PROJ-T1"
+    assert results[0].status == "Pass"
+    assert results[1] is None
+
+
+def test_create_testrun_results_sends_one_bulk_request():
+    """Results for one test run are created through the bulk endpoint."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(201, json={"ids": [11, 12]})
+
+    fetcher = _fetcher(handler)
+    ids = asyncio.run(
+        fetcher.create_testrun_results(
+            "PROJ-C1", [("PROJ-T1", {"status": "Pass"}), ("PROJ-T2", {"status": "Fail"})]
+        )
+    )
+
+    assert ids == [11, 12]
+    assert len(requests) == 1
+    assert requests[0].method == "POST"
+    assert requests[0].url.path == "/testrun/PROJ-C1/testresults"
+
+
+def test_create_testrun_results_reports_created_ids_on_failure():
+    """A short bulk response fails the call but keeps the returned IDs."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(201, json={"ids": [11]})
+
+    fetcher = _fetcher(handler)
+    with pytest.raises(MCPAtlassianBulkCreateError) as exc_info:
+        asyncio.run(
+            fetcher.create_testrun_results(
+                "PROJ-C1", [("PROJ-T1", {"status": "Pass"}), ("PROJ-T2", {"status": "Fail"})]
+            )
+        )
+
+    assert exc_info.value.created_ids == [11]